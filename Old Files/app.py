@@ -4,6 +4,9 @@
 
 import streamlit as st
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+import json
 import backend
 import config
 
@@ -17,19 +20,160 @@ if not config.validate_config():
 st.set_page_config(layout="wide")
 st.title("FAST Capital Dossier & Outreach Pipeline")
 
-def _get_scalar_from_series(series, key, row_index_for_warning):
+@dataclass(slots=True)
+class ProcessedLead:
     """
-    Safely extracts a scalar value from a pandas Series, handling cases where
-    duplicate column names might cause `series.get(key)` to return a Series.
+    Result of researching one lead. Holds only the scalars the review screen
+    needs instead of dragging the full pandas row through session state.
     """
-    val = series.get(key)
-    if isinstance(val, pd.Series):
-        st.warning(
-            f"Warning for row {row_index_for_warning}: Duplicate column mapping for '{key}'. "
-            f"Using the first value found. Please check your Google Sheet for columns with the same name."
+    prospect_name: str
+    company_name: str
+    prospect_email: str
+    row_index: int
+    dossier: dict
+    email: dict
+    dossier_json: str
+    sources_json: str
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _sheet_columns(_worksheet, worksheet_id):
+    """
+    Header row for a worksheet, cached briefly so the mapping screen does not
+    refetch it on every selectbox rerun. `_worksheet` is unhashable and
+    excluded from the cache key; `worksheet_id` keys the entry.
+    """
+    return [h for h in _worksheet.row_values(1) if h]
+
+def _process_lead(index, lead):
+    """
+    Research and synthesize a single lead. Runs in a worker thread, so no
+    st.* calls are allowed here. Columns are deduplicated at fetch time, so
+    every lookup returns a scalar.
+    """
+    row_num = index + 2  # GSheets are 1-indexed, +1 for header
+
+    company_name = lead.get('Company_Name')
+    prospect_name = lead.get('Prospect_Name')
+    prospect_email = lead.get('Prospect_Email')
+    prospect_phone = lead.get('Prospect_Phone')
+
+    dossier = backend.gather_osint(
+        company_name=company_name,
+        prospect_name=prospect_name,
+        prospect_email=prospect_email,
+        prospect_phone=prospect_phone
+    )
+    email_assets = backend.create_outreach_assets(dossier, prospect_name)
+
+    # Serialize once here, off the approval path. The dossier is immutable
+    # after generation; indent=2 stays because reviewers read the cells raw.
+    sources = []
+    if isinstance(dossier, dict):
+        sources = (
+            dossier.get("dossier", {}).get("sources")
+            or dossier.get("sources")
+            or []
         )
-        return val.iloc[0] if not val.empty else None
-    return val
+
+    return ProcessedLead(
+        prospect_name=prospect_name,
+        company_name=company_name,
+        prospect_email=prospect_email,
+        row_index=row_num,
+        dossier=dossier,
+        email=email_assets,
+        dossier_json=json.dumps(dossier, indent=2),
+        sources_json=json.dumps(sources, indent=2),
+    )
+
+FLUSH_EVERY = 20  # rows queued before a write, to stay under the Sheets write quota
+
+def _flush_pending(force=False):
+    """Write queued row updates to the sheet in a single batched call."""
+    pending = st.session_state.pending_updates
+    if not pending or (len(pending) < FLUSH_EVERY and not force):
+        return
+    success, msg = backend.batch_update_google_sheet(
+        st.session_state.worksheet, pending, st.session_state.final_column_map
+    )
+    if success:
+        st.session_state.pending_updates = []
+        st.toast(f"Google Sheet updated ({len(pending)} row(s)).")
+    else:
+        st.error(f"Sheet Update Failed: {msg}")
+
+@st.fragment
+def _review_panel():
+    """
+    Review one lead at a time. Runs as a fragment so Approve/Skip clicks
+    rerun only this panel instead of the whole script (config validation,
+    mapping state, etc.).
+    """
+    if st.session_state.current_index < len(st.session_state.processed_data):
+        current_item = st.session_state.processed_data[st.session_state.current_index]
+        dossier_info = current_item.dossier
+        email_info = current_item.email
+        row_num = current_item.row_index
+
+        st.subheader(f"Reviewing Lead {st.session_state.current_index + 1}/{len(st.session_state.processed_data)}: {current_item.prospect_name or 'N/A'} at {current_item.company_name or 'N/A'}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Generated Dossier")
+            # Rendered collapsed: expanding a 20KB+ JSON tree up front
+            # dominates the review-panel paint time.
+            with st.expander("Dossier JSON", expanded=False):
+                st.json(dossier_info, expanded=False)
+        with col2:
+            st.markdown("#### Generated Email")
+            st.text_input("Subject", email_info.get('Selected_Email_Subject', ''), disabled=True, key=f"subject_{row_num}")
+            st.text_area("Body", email_info.get('Selected_Email_Body', ''), height=400, disabled=True, key=f"body_{row_num}")
+
+        # Action buttons
+        approve_col, skip_col, spacer = st.columns([1, 1, 5])
+        with approve_col:
+            if st.button("✅ Approve & Send", use_container_width=True, type="primary"):
+                with st.spinner("Sending email..."):
+                    sent = backend.send_email(
+                        recipient_email=current_item.prospect_email,
+                        subject=email_info.get('Selected_Email_Subject'),
+                        body=email_info.get('Selected_Email_Body')
+                    )
+                    if sent:
+                        st.toast("Email sent successfully!")
+                        # Queue the row update; writes go out in one batch.
+                        st.session_state.pending_updates.append(
+                            {'row': row_num, 'status': "Sent", 'email': email_info,
+                             'dossier_json': current_item.dossier_json,
+                             'sources_json': current_item.sources_json}
+                        )
+                        _flush_pending()
+                    else:
+                        st.error("Failed to send email. Check dispatch logs.")
+
+                st.session_state.current_index += 1
+                st.rerun(scope="fragment")
+
+        with skip_col:
+            if st.button("⏩ Skip", use_container_width=True):
+                st.session_state.pending_updates.append(
+                    {'row': row_num, 'status': "Skipped", 'email': email_info,
+                     'dossier_json': current_item.dossier_json,
+                     'sources_json': current_item.sources_json}
+                )
+                _flush_pending()
+                st.toast("Lead skipped.")
+
+                st.session_state.current_index += 1
+                st.rerun(scope="fragment")
+    else:
+        with st.spinner("Writing reviewed leads to the Google Sheet..."):
+            _flush_pending(force=True)
+        st.success("🎉 All leads have been reviewed. Pipeline run complete!")
+        if st.button("Start New Batch"):
+            # Clear state to allow a new run without restarting the server
+            st.session_state.clear()
+            st.rerun()
 
 # --- Session State Initialization ---
 DEFAULTS = {
@@ -44,6 +188,7 @@ DEFAULTS = {
     "leads_df": pd.DataFrame(),
     "processed_data": [],
     "current_index": 0,
+    "pending_updates": [],
 }
 for key, value in DEFAULTS.items():
     if key not in st.session_state:
@@ -101,12 +246,14 @@ elif st.session_state.sheet_loaded and not st.session_state.mapping_complete:
     }
 
     try:
-        sheet_columns = [h for h in st.session_state.worksheet.row_values(1) if h]
+        sheet_columns = _sheet_columns(st.session_state.worksheet, st.session_state.worksheet.id)
     except Exception as e:
         st.error(f"Could not read columns from the spreadsheet. Error: {e}")
         sheet_columns = []
 
     available_columns = ["---"] + sheet_columns
+    # Normalize the sheet header once instead of rescanning it per required column.
+    norm_map = {col.lower().replace("_", "").replace(" ", ""): col for col in sheet_columns}
     col1, col2 = st.columns(2)
     all_mapped = True
 
@@ -117,13 +264,8 @@ elif st.session_state.sheet_loaded and not st.session_state.mapping_complete:
             options = [create_option] + available_columns
             current_selection = st.session_state.user_mapping.get(req_col)
             if not current_selection:
-                normalized_req = req_col.lower().replace("_", "").replace(" ", "")
-                for col in sheet_columns:
-                    normalized_sheet = col.lower().replace("_", "").replace(" ", "")
-                    if normalized_req == normalized_sheet:
-                        current_selection = col
-                        break
-            
+                current_selection = norm_map.get(req_col.lower().replace("_", "").replace(" ", ""))
+
             default_index = 0
             if current_selection and current_selection in options:
                 default_index = options.index(current_selection)
@@ -155,7 +297,18 @@ elif st.session_state.mapping_complete and not st.session_state.processing_start
 
     with st.spinner("Fetching new leads based on your mapping..."):
         if st.session_state.all_leads.empty:
-            st.session_state.all_leads = backend.get_new_leads(st.session_state.worksheet, st.session_state.user_mapping)
+            leads = backend.get_new_leads(st.session_state.worksheet, st.session_state.user_mapping)
+            # Duplicate headers are a property of the sheet, so resolve them
+            # once here (keeping the first occurrence) instead of checking
+            # every value on every row later.
+            dupe_cols = leads.columns[leads.columns.duplicated()].tolist()
+            if dupe_cols:
+                st.warning(
+                    f"Duplicate column names found in the sheet: {dupe_cols}. "
+                    "Using the first occurrence of each. Please check your Google Sheet."
+                )
+                leads = leads.loc[:, ~leads.columns.duplicated()]
+            st.session_state.all_leads = leads
     
     if not st.session_state.all_leads.empty:
         st.info(f"Found {len(st.session_state.all_leads)} new leads in the Google Sheet.")
@@ -173,113 +326,32 @@ elif st.session_state.mapping_complete and not st.session_state.processing_start
 
             with st.spinner("Generating dossiers and emails... This may take a few minutes."):
                 progress_bar = st.progress(0, text="Initializing...")
-                processed_list = []
                 total = len(st.session_state.leads_df)
 
-                for i, (index, lead) in enumerate(st.session_state.leads_df.iterrows()):
-                    row_num_for_display = index + 2  # For user-facing messages
-
-                    # Safely extract scalar values, handling potential duplicate columns
-                    company_name = _get_scalar_from_series(lead, 'Company_Name', row_num_for_display)
-                    prospect_name = _get_scalar_from_series(lead, 'Prospect_Name', row_num_for_display)
-                    prospect_email = _get_scalar_from_series(lead, 'Prospect_Email', row_num_for_display)
-                    prospect_phone = _get_scalar_from_series(lead, 'Prospect_Phone', row_num_for_display)
-
-                    progress_text = f"Processing lead {i+1}/{total}: {prospect_name or 'N/A'}"
-                    progress_bar.progress((i + 1) / total, text=progress_text)
-
-                    dossier = backend.gather_osint(
-                        company_name=company_name,
-                        prospect_name=prospect_name,
-                        prospect_email=prospect_email,
-                        prospect_phone=prospect_phone
-                    )
-                    email_assets = backend.create_outreach_assets(dossier, prospect_name)
-
-                    processed_list.append({
-                        'lead': lead,
-                        'dossier': dossier,
-                        'email': email_assets,
-                        'row_index': index + 2  # GSheets are 1-indexed, +1 for header
-                    })
-
+                # Both Gemini calls per lead are network-bound, so leads are
+                # processed concurrently; results are re-ordered to match the
+                # sheet before review.
+                results = {}
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    futures = {
+                        pool.submit(_process_lead, index, lead): index
+                        for index, lead in st.session_state.leads_df.iterrows()
+                    }
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        results[futures[future]] = future.result()
+                        progress_bar.progress(done / total, text=f"Processed lead {done}/{total}")
+
+                processed_list = [results[index] for index in st.session_state.leads_df.index]
                 st.session_state.processed_data = processed_list
             st.success(f"Successfully processed {len(processed_list)} leads. Ready for review.")
             st.rerun()
     else:
         st.warning("No new leads found in the Google Sheet.")
         if st.button("Start Over"):
-            for key in st.session_state.keys():
-                del st.session_state[key]
+            st.session_state.clear()
             st.rerun()
 
-# STATE 3: Review - After processing is complete
-elif st.session_state.processing_started: # This is now STATE 4
+# STATE 4: Review - After processing is complete
+elif st.session_state.processing_started:
     st.header("Step 4: Review and Approve Emails")
-
-    if st.session_state.current_index < len(st.session_state.processed_data):
-        current_item = st.session_state.processed_data[st.session_state.current_index]
-        dossier_info = current_item['dossier']
-        email_info = current_item['email']
-        row_num = current_item['row_index']
-
-        # Safely extract scalar values for display and actions
-        lead_prospect_name = _get_scalar_from_series(current_item['lead'], 'Prospect_Name', row_num)
-        lead_company_name = _get_scalar_from_series(current_item['lead'], 'Company_Name', row_num)
-        lead_prospect_email = _get_scalar_from_series(current_item['lead'], 'Prospect_Email', row_num)
-
-
-        st.subheader(f"Reviewing Lead {st.session_state.current_index + 1}/{len(st.session_state.processed_data)}: {lead_prospect_name or 'N/A'} at {lead_company_name or 'N/A'}")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### Generated Dossier")
-            st.json(dossier_info, expanded=True)
-        with col2:
-            st.markdown("#### Generated Email")
-            st.text_input("Subject", email_info.get('Selected_Email_Subject', ''), disabled=True, key=f"subject_{row_num}")
-            st.text_area("Body", email_info.get('Selected_Email_Body', ''), height=400, disabled=True, key=f"body_{row_num}")
-
-        # Action buttons
-        approve_col, skip_col, spacer = st.columns([1, 1, 5])
-        with approve_col:
-            if st.button("✅ Approve & Send", use_container_width=True, type="primary"):
-                with st.spinner("Sending email and updating sheet..."):
-                    sent = backend.send_email(
-                        recipient_email=lead_prospect_email,
-                        subject=email_info.get('Selected_Email_Subject'),
-                        body=email_info.get('Selected_Email_Body')
-                    )
-                    if sent:
-                        st.toast("Email sent successfully!")
-                        # Use the worksheet from session state for the update
-                        success, msg = backend.update_google_sheet(st.session_state.worksheet, row_num, "Sent", dossier_info, email_info, st.session_state.final_column_map)
-                        if success:
-                            st.toast("Google Sheet updated.")
-                        else:
-                            st.error(f"Sheet Update Failed: {msg}")
-                    else:
-                        st.error("Failed to send email. Check dispatch logs.")
-                
-                st.session_state.current_index += 1
-                st.rerun()
-
-        with skip_col:
-            if st.button("⏩ Skip", use_container_width=True):
-                with st.spinner("Updating sheet with 'Skipped' status..."):
-                    # Use the worksheet from session state for the update
-                    success, msg = backend.update_google_sheet(st.session_state.worksheet, row_num, "Skipped", dossier_info, email_info, st.session_state.final_column_map)
-                    if success:
-                        st.toast("Lead skipped. Google Sheet updated.")
-                    else:
-                        st.error(f"Sheet Update Failed: {msg}")
-
-                st.session_state.current_index += 1
-                st.rerun()
-    else:
-        st.success("🎉 All leads have been reviewed. Pipeline run complete!")
-        if st.button("Start New Batch"):
-            # Clear state to allow a new run without restarting the server
-            for key in st.session_state.keys():
-                del st.session_state[key]
-            st.rerun()
+    _review_panel()
@@ -7,7 +7,9 @@ import os
 import json
 import smtplib
 import ssl
+import threading
 from email.message import EmailMessage
+from functools import lru_cache
 from typing import Dict, Any, List
 
 import gspread
@@ -29,6 +31,9 @@ import config
 # ──────────────────────────────────────────────────────────────────────────────
 GENAI_CLIENT = None
 MODEL_ID = getattr(config, "GEMINI_MODEL_ID", "gemini-2.5-pro")  # 2.5 Pro supports Search grounding
+# Synthesis only reformats an already-researched report into five short
+# fields, so it runs on the cheaper/faster Flash model by default.
+SYNTHESIS_MODEL_ID = getattr(config, "GEMINI_SYNTHESIS_MODEL_ID", "gemini-2.5-flash")
 
 try:
     if not getattr(config, "GEMINI_API_KEY", None):
@@ -174,11 +179,13 @@ def get_new_leads(worksheet: gspread.Worksheet, user_mapping: Dict[str, str]) ->
     and filters for new leads (where Status is empty or "New").
     """
     try:
-        all_records = worksheet.get_all_records(head=1)
-        if not all_records:
+        # get_all_values returns the sheet as one nested list; building the
+        # DataFrame from it directly skips gspread's per-row dict construction.
+        values = worksheet.get_all_values()
+        if len(values) < 2:
             return pd.DataFrame()
 
-        df = pd.DataFrame.from_records(all_records)
+        df = pd.DataFrame(values[1:], columns=values[0])
 
         # Create a reverse mapping from the actual sheet column name to our standard name
         # e.g., {'Contact Name': 'Prospect_Name', 'Status': 'Status'}
@@ -200,7 +207,7 @@ def get_new_leads(worksheet: gspread.Worksheet, user_mapping: Dict[str, str]) ->
 
         # Filter for leads with an empty or "New" status (case-insensitive)
         new_leads_df = df[
-            df["Status"].fillna("").astype(str).str.strip().str.lower().isin(["", "new"])
+            df["Status"].fillna("").astype(str).str.strip().str.lower().isin(frozenset(("", "new")))
         ].copy()
 
         return new_leads_df
@@ -221,6 +228,10 @@ def get_column_map(worksheet: gspread.Worksheet) -> Dict[str, int]:
 # Enrichment (OSINT) with Google Search grounding
 # ──────────────────────────────────────────────────────────────────────────────
 
+# The prompt files are read once per process: gather_osint/create_outreach_assets
+# call these loaders on every lead, and the files never change mid-run. lru_cache
+# keeps this module Streamlit-free (st.cache_data would tie backend to the UI).
+@lru_cache(maxsize=1)
 def load_master_prompt() -> str:
     """Load the deep research prompt from 'master_prompt.txt'."""
     try:
@@ -229,6 +240,7 @@ def load_master_prompt() -> str:
     except FileNotFoundError:
         raise FileNotFoundError("Backend ERROR: 'master_prompt.txt' not found in the project directory.")
 
+@lru_cache(maxsize=1)
 def load_direct_marketing_samples() -> str:
     """Load direct marketing samples from 'direct_marketing_samples.txt'."""
     try:
@@ -238,6 +250,7 @@ def load_direct_marketing_samples() -> str:
         print("Backend WARNING: 'direct_marketing_samples.txt' not found. Proceeding without it.")
         return ""
 
+@lru_cache(maxsize=1)
 def load_successful_emails() -> str:
     """Load successful email templates from 'successful_emails.txt'."""
     try:
@@ -296,14 +309,21 @@ def gather_osint(company_name: str, prospect_name: str, prospect_email: str, pro
             temperature=0.2,
         )
 
-        response = GENAI_CLIENT.models.generate_content(
+        # Stream the response so text accumulates as the model generates it
+        # instead of blocking until the full payload is buffered server-side.
+        # Grounding metadata rides on the trailing chunk.
+        text_parts = []
+        last_chunk = None
+        for chunk in GENAI_CLIENT.models.generate_content_stream(
             model=MODEL_ID,
             contents=formatted_prompt,
             config=gen_config,
-        )
+        ):
+            text_parts.append(getattr(chunk, "text", "") or "")
+            last_chunk = chunk
 
         # Parse model JSON
-        _resp_text = getattr(response, "text", "") or ""
+        _resp_text = "".join(text_parts)
         if not _resp_text.strip():
             # If the model returned no direct text (can happen with tool use), fall back to an empty JSON object
             _resp_text = "{}"
@@ -314,7 +334,7 @@ def gather_osint(company_name: str, prospect_name: str, prospect_email: str, pro
             data = {"dossier": {"summary": _resp_text}}
 
         # Attach grounded sources into the expected location if present
-        sources = _extract_sources_from_grounding(response)
+        sources = _extract_sources_from_grounding(last_chunk)
         if sources:
             if isinstance(data, dict):
                 if "dossier" in data and isinstance(data["dossier"], dict):
@@ -368,7 +388,9 @@ You MUST return a single, valid JSON object with the following five keys. Do not
     - **Use "[First Name]" as a placeholder for the prospect's first name only.**
 """
 
+@lru_cache(maxsize=1024)
 def extract_first_name(full_name: str) -> str:
+    # Pure function; names repeat across batches and reruns, so memoize.
     if not full_name or not isinstance(full_name, str):
         return "there"
     return full_name.split()[0]
@@ -402,7 +424,7 @@ def create_outreach_assets(intelligence_report: Dict[str, Any], prospect_name: s
         )
 
         response = GENAI_CLIENT.models.generate_content(
-            model=MODEL_ID,
+            model=SYNTHESIS_MODEL_ID,
             contents=prompt,
             config=gen_config,
         )
@@ -422,8 +444,50 @@ def create_outreach_assets(intelligence_report: Dict[str, Any], prospect_name: s
 # Dispatch (Email)
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Built once at import; identical for every outgoing email.
+SIGNATURE = """
+-- 
+Sincerely,
+
+Graham Gordon
+FastCapitalNYC.com
+Growth Funding Architect
+(o)(917) 745-3378
+info@fastcapitalnyc.com
+Apply for Funding
+""".strip("\n")
+
+# A single logged-in connection is reused across a review batch instead of
+# paying the TLS handshake + AUTH (~3 round trips) on every approval. Kept
+# module-level (not st.cache_resource) so backend stays Streamlit-free.
+_SMTP_LOCK = threading.Lock()
+_SMTP_CONN = None
+
+
+def _get_smtp():
+    """Return the shared logged-in SMTP connection, creating it on demand. Callers must hold _SMTP_LOCK."""
+    global _SMTP_CONN
+    if _SMTP_CONN is None:
+        context = ssl.create_default_context()
+        conn = smtplib.SMTP_SSL(config.SMTP_SERVER, config.SMTP_PORT, context=context)
+        conn.login(config.SENDER_EMAIL, config.SENDER_APP_PASSWORD)
+        _SMTP_CONN = conn
+    return _SMTP_CONN
+
+
+def _drop_smtp():
+    """Discard the pooled connection so the next send reconnects. Callers must hold _SMTP_LOCK."""
+    global _SMTP_CONN
+    if _SMTP_CONN is not None:
+        try:
+            _SMTP_CONN.close()
+        except Exception:
+            pass
+        _SMTP_CONN = None
+
+
 def send_email(recipient_email: str, subject: str, body: str) -> bool:
-    """Send email via SMTP using creds from config."""
+    """Send email via SMTP using creds from config, reusing a pooled connection."""
     if not all([config.SENDER_EMAIL, config.SENDER_APP_PASSWORD]):
         print("Backend Error: SENDER_EMAIL or SENDER_APP_PASSWORD not set in config.")
         return False
@@ -435,29 +499,22 @@ def send_email(recipient_email: str, subject: str, body: str) -> bool:
     msg["Subject"] = subject
     msg["From"] = config.SENDER_EMAIL
     msg["To"] = recipient_email
-
-    signature = """
--- 
-Sincerely,
-
-Graham Gordon
-FastCapitalNYC.com
-Growth Funding Architect
-(o)(917) 745-3378
-info@fastcapitalnyc.com
-Apply for Funding
-""".strip("\n")
-    full_body = body + "\n\n" + signature
-    msg.set_content(full_body)
+    # Explicit charset skips the ASCII-first content autodetection pass.
+    msg.set_content("\n\n".join((body, SIGNATURE)), charset="utf-8")
 
     try:
-        context = ssl.create_default_context()
-        with smtplib.SMTP_SSL(config.SMTP_SERVER, config.SMTP_PORT, context=context) as server:
-            server.login(config.SENDER_EMAIL, config.SENDER_APP_PASSWORD)
-            server.send_message(msg)
+        with _SMTP_LOCK:
+            try:
+                _get_smtp().send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                # Gmail drops idle sessions; rebuild the connection once and retry.
+                _drop_smtp()
+                _get_smtp().send_message(msg)
         print(f"Backend: Email sent successfully to {recipient_email}.")
         return True
     except Exception as e:
+        with _SMTP_LOCK:
+            _drop_smtp()
         print(f"Backend ERROR: Failed to send email: {e}")
         return False
 
@@ -469,20 +526,18 @@ Apply for Funding
 def update_google_sheet(worksheet: gspread.Worksheet, row_index: int, status: str, dossier: Dict, email_assets: Dict, col_map: Dict[str, int]):
     """Update a single lead row with results in the provided worksheet."""
     try:
-        cells_to_update = [
-            gspread.Cell(row_index, col_map["Status"], status),
-            gspread.Cell(row_index, col_map["Prospect_Title"], email_assets.get("Prospect_Title", "")),
-            gspread.Cell(row_index, col_map["Halbert_Hook"], email_assets.get("Halbert_Hook", "")),
-            gspread.Cell(row_index, col_map["Capital_Need_Hypothesis"], email_assets.get("Capital_Need_Hypothesis", "")),
-            gspread.Cell(row_index, col_map["Selected_Email_Subject"], email_assets.get("Selected_Email_Subject", "")),
-            gspread.Cell(row_index, col_map["Selected_Email_Body"], email_assets.get("Selected_Email_Body", "")),
+        updates = [
+            (col_map["Status"], status),
+            (col_map["Prospect_Title"], email_assets.get("Prospect_Title", "")),
+            (col_map["Halbert_Hook"], email_assets.get("Halbert_Hook", "")),
+            (col_map["Capital_Need_Hypothesis"], email_assets.get("Capital_Need_Hypothesis", "")),
+            (col_map["Selected_Email_Subject"], email_assets.get("Selected_Email_Subject", "")),
+            (col_map["Selected_Email_Body"], email_assets.get("Selected_Email_Body", "")),
         ]
 
         # Safely add JSON data if the columns exist
         if "Dossier_JSON" in col_map:
-            cells_to_update.append(
-                gspread.Cell(row_index, col_map["Dossier_JSON"], json.dumps(dossier, indent=2))
-            )
+            updates.append((col_map["Dossier_JSON"], json.dumps(dossier, indent=2)))
         if "Sources" in col_map:
             # Prefer nested dossier.sources if present
             sources_data = []
@@ -492,11 +547,77 @@ def update_google_sheet(worksheet: gspread.Worksheet, row_index: int, status: st
                     or dossier.get("sources")
                     or []
                 )
-            cells_to_update.append(
-                gspread.Cell(row_index, col_map["Sources"], json.dumps(sources_data, indent=2))
-            )
-
-        worksheet.update_cells(cells_to_update)
+            updates.append((col_map["Sources"], json.dumps(sources_data, indent=2)))
+
+        # Collapse runs of adjacent columns into single A1 ranges; output
+        # columns usually sit side by side, so the payload is typically one
+        # or two ranges instead of one entry (or Cell object) per value.
+        def run_entry(cols, values):
+            start = gspread.utils.rowcol_to_a1(row_index, cols[0])
+            if len(cols) == 1:
+                return {"range": start, "values": [values]}
+            end = gspread.utils.rowcol_to_a1(row_index, cols[-1])
+            return {"range": f"{start}:{end}", "values": [values]}
+
+        updates.sort(key=lambda cv: cv[0])
+        data = []
+        run_cols, run_values = [], []
+        for col, value in updates:
+            if run_cols and col != run_cols[-1] + 1:
+                data.append(run_entry(run_cols, run_values))
+                run_cols, run_values = [], []
+            run_cols.append(col)
+            run_values.append(value)
+        if run_cols:
+            data.append(run_entry(run_cols, run_values))
+
+        worksheet.batch_update(data, value_input_option="RAW")
         return True, f"Successfully updated row {row_index} with status '{status}'."
     except Exception as e:
         return False, f"Failed to update sheet: {e}"
+
+
+def batch_update_google_sheet(worksheet: gspread.Worksheet, pending: List[Dict[str, Any]], col_map: Dict[str, int]):
+    """
+    Flush a queue of per-lead updates in a single batch_update call.
+
+    Each queued item is {'row': int, 'status': str, 'email': dict,
+    'dossier_json': str, 'sources_json': str} — the JSON payloads arrive
+    pre-serialized so the flush does no per-lead dumps work. One API round
+    trip covers the whole queue instead of one worksheet.update_cells call
+    per reviewed lead.
+    """
+    if not pending:
+        return True, "No pending updates to flush."
+    try:
+        data = []
+
+        def queue_cell(row, col, value):
+            data.append({
+                "range": gspread.utils.rowcol_to_a1(row, col),
+                "values": [[value]],
+            })
+
+        for item in pending:
+            row = item["row"]
+            email_assets = item.get("email") or {}
+
+            queue_cell(row, col_map["Status"], item.get("status", ""))
+            for key in (
+                "Prospect_Title",
+                "Halbert_Hook",
+                "Capital_Need_Hypothesis",
+                "Selected_Email_Subject",
+                "Selected_Email_Body",
+            ):
+                queue_cell(row, col_map[key], email_assets.get(key, ""))
+
+            if "Dossier_JSON" in col_map:
+                queue_cell(row, col_map["Dossier_JSON"], item.get("dossier_json", ""))
+            if "Sources" in col_map:
+                queue_cell(row, col_map["Sources"], item.get("sources_json", ""))
+
+        worksheet.batch_update(data, value_input_option="RAW")
+        return True, f"Successfully flushed {len(pending)} queued row update(s) in one batch."
+    except Exception as e:
+        return False, f"Failed to batch-update sheet: {e}"
@@ -1,12 +1,27 @@
 # dispatch.py
 # Module 4: Sends the finalized email to the prospect.
 # v1_2025-08-18: Using Python's smtplib for direct, high-impact SMTP dispatch.
+# v2_2025-08-31: Reuse a single SMTP_SSL session across sends via SMTPDispatcher.
+# v3_2025-08-31: Retry transient SMTP failures with exponential backoff + jitter.
+# v4_2025-08-31: Parallel bulk dispatch over a bounded pool of SMTP connections.
+# v5_2025-08-31: Optional STARTTLS on port 587 as an alternative to implicit SSL.
 
+import copy
+import logging
 import os
+import queue
+import random
 import smtplib
+import socket
 import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
 
+# Lazy %-style logging: when a level is disabled the format call never runs,
+# unlike eagerly-built f-string prints.
+logger = logging.getLogger(__name__)
+
 # --- Configuration ---
 # Load sensitive credentials from environment variables for security.
 # IMPORTANT: For Gmail/Google Workspace, you must generate an "App Password".
@@ -24,6 +39,7 @@ SENDER_EMAIL = os.environ.get('SENDER_EMAIL')
 SENDER_APP_PASSWORD = os.environ.get('SENDER_APP_PASSWORD')
 SMTP_SERVER = "smtp.gmail.com" # For Google Workspace/Gmail
 SMTP_PORT = 465 # For SSL connection
+SMTP_STARTTLS_PORT = 587 # For STARTTLS (explicit TLS) connection
 
 # NEW: Load personal/business information from environment variables
 SENDER_NAME = os.environ.get('SENDER_NAME', 'Graham Gordon')
@@ -31,36 +47,15 @@ SENDER_COMPANY = os.environ.get('SENDER_COMPANY', 'FastCapitalNYC.com')
 SENDER_PHONE = os.environ.get('SENDER_PHONE', '(917) 745-3378')
 SENDER_INFO_EMAIL = os.environ.get('SENDER_INFO_EMAIL', 'info@fastcapitalnyc.com')
 
-# --- Core Dispatch Function ---
+# Built once at import: re-creating the default context re-reads CA certs
+# from disk on every call. SSLContext is safe to share across connections.
+_SSL_CONTEXT = ssl.create_default_context()
 
-def send_email(recipient_email: str, subject: str, body: str):
-    """
-    Connects to a Google SMTP server and sends a personalized email.
+# The signature only interpolates values read from the environment at
+# import, so build it once instead of per message.
+_SIGNATURE = f"""
 
-    Args:
-        recipient_email (str): The prospect's email address.
-        subject (str): The email subject line.
-        body (str): The email content.
-
-    Returns:
-        bool: True if the email was sent successfully, False otherwise.
-    """
-    # --- Input Validation ---
-    if not all([SENDER_EMAIL, SENDER_APP_PASSWORD]):
-        print("  [DISPATCH] Error: SENDER_EMAIL or SENDER_APP_PASSWORD env variables not set.")
-        return False
-        
-    if not all([recipient_email, subject, body]):
-        print("  [DISPATCH] Error: Missing recipient, subject, or body. Cannot send email.")
-        return False
 
-    msg = EmailMessage()
-    msg['Subject'] = subject
-    msg['From'] = SENDER_EMAIL
-    msg['To'] = recipient_email
-    
-    # UPDATED: Use environment variables for signature instead of hardcoded values
-    signature = f"""
 --
 Sincerely,
 
@@ -73,27 +68,272 @@ Apply for Funding
 
 "It always seems impossible until it's done." - Nelson Mandela
 """
-    full_body = body + "\n\n" + signature
-    msg.set_content(full_body)
 
-    print(f"  [DISPATCH] Preparing to send email to '{recipient_email}' via Google SMTP...")
+# Message skeleton with the constant headers pre-set. Per send we clone it
+# and fill in only the recipient-specific parts instead of rebuilding the
+# whole message from scratch for every prospect in a batch.
+_MESSAGE_TEMPLATE = EmailMessage()
+if SENDER_EMAIL:
+    _MESSAGE_TEMPLATE['From'] = SENDER_EMAIL
 
-    try:
-        context = ssl.create_default_context()
-        with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context) as server:
-            server.login(SENDER_EMAIL, SENDER_APP_PASSWORD)
+def _build_message(recipient_email: str, subject: str, body: str) -> EmailMessage:
+    """Clones the prebuilt message skeleton and fills in per-recipient fields."""
+    # deepcopy, not copy: Message instances share their header list under a
+    # shallow copy, which would leak headers across messages.
+    msg = copy.deepcopy(_MESSAGE_TEMPLATE)
+    msg['Subject'] = subject
+    msg['To'] = recipient_email
+    msg.set_content(body + _SIGNATURE)
+    return msg
+
+
+# --- Retry Helper ---
+
+def _is_transient_smtp_error(exc: Exception) -> bool:
+    """
+    Classifies an SMTP failure as transient (worth retrying) or permanent.
+    Transient: dropped/unreachable connections, timeouts, and 4xx responses
+    (greylisting, momentary rate limits). Permanent: auth failures, refused
+    recipients, and 5xx responses.
+    """
+    if isinstance(exc, (smtplib.SMTPAuthenticationError, smtplib.SMTPRecipientsRefused)):
+        return False
+    if isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, socket.timeout)):
+        return True
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    return False
+
+def _retry(fn, max_retries: int = 3, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5):
+    """
+    Calls fn(), retrying transient SMTP errors with exponential backoff and
+    jitter: delay = min(cap, base * 2**attempt * (1 + random*jitter)).
+    Permanent errors (and exhausted retries) propagate to the caller.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= max_retries or not _is_transient_smtp_error(e):
+                raise
+            delay = min(cap, base * (2 ** attempt) * (1 + random.random() * jitter))
+            logger.warning("    [RETRY] Transient SMTP error (%s). Retrying in %.1fs (attempt %s/%s)...", e, delay, attempt + 1, max_retries)
+            time.sleep(delay)
+
+
+# --- Core Dispatch Class ---
+
+class SMTPDispatcher:
+    """
+    Manages a single persistent SMTP_SSL session so a batch of outreach
+    emails pays the TLS handshake + AUTH cost once instead of per message.
+
+    Usage:
+        with SMTPDispatcher() as dispatcher:
+            for prospect in prospects:
+                dispatcher.send_email(prospect_email, subject, body)
+    """
+
+    # Gmail tears down sessions after ~100 messages; rotate just under that
+    # so a long batch never loses an in-flight message to a server-side QUIT.
+    DEFAULT_MAX_PER_SESSION = 95
+
+    def __init__(self, server: str = SMTP_SERVER, port: int = SMTP_PORT,
+                 max_per_session: int = DEFAULT_MAX_PER_SESSION,
+                 use_starttls: bool = False):
+        self.server = server
+        # STARTTLS upgrades a plaintext connection on 587; implicit SSL
+        # expects 465. Fix up the port if the caller only flipped the flag.
+        if use_starttls and port == SMTP_PORT:
+            port = SMTP_STARTTLS_PORT
+        self.port = port
+        self.use_starttls = use_starttls
+        self.max_per_session = max_per_session
+        self._conn = None
+        self._sent_on_session = 0
+        # ESMTP extensions advertised by the server, captured once per session.
+        self.esmtp_features = {}
+
+    def _ensure_connection(self):
+        """
+        Returns a live, authenticated SMTP connection, reconnecting and
+        re-authenticating if the cached one has gone stale.
+        """
+        if self._conn is not None:
+            # Proactively rotate before the provider's per-session cap kicks in.
+            if self._sent_on_session >= self.max_per_session:
+                logger.info("  [DISPATCH] Rotating SMTP session after %s sends.", self._sent_on_session)
+                self.close()
+            else:
+                try:
+                    # NOOP is the cheapest way to probe a cached session.
+                    if self._conn.noop()[0] == 250:
+                        return self._conn
+                except Exception:
+                    pass  # Stale connection; fall through and rebuild it.
+                self.close()
+
+        if self.use_starttls:
+            # Explicit TLS: plain connect, then upgrade. Sharing _SSL_CONTEXT
+            # across the pool lets OpenSSL resume TLS sessions on reconnect,
+            # skipping the full handshake when a session rotates.
+            conn = smtplib.SMTP(self.server, self.port)
+            conn.ehlo()
+            conn.starttls(context=_SSL_CONTEXT)
+            conn.ehlo()
+        else:
+            conn = smtplib.SMTP_SSL(self.server, self.port, context=_SSL_CONTEXT)
+        _retry(lambda: conn.login(SENDER_EMAIL, SENDER_APP_PASSWORD))
+
+        # login() already performed the EHLO exchange; persist the advertised
+        # extensions so nothing re-issues EHLO per send. smtplib's
+        # send_message consults the same cached features, so PIPELINING is
+        # used automatically when the server (e.g. Gmail) offers it.
+        self.esmtp_features = dict(conn.esmtp_features)
+        pipelining = 'pipelining' in self.esmtp_features
+        chunking = 'chunking' in self.esmtp_features
+        logger.info("  [DISPATCH] Established new SMTP session (pipelining=%s, chunking=%s).", pipelining, chunking)
+
+        self._conn = conn
+        return self._conn
+
+    def close(self):
+        """Gracefully QUITs and discards the cached connection, if any."""
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except Exception:
+                pass
+            self._conn = None
+        self._sent_on_session = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def send_email(self, recipient_email: str, subject: str, body: str):
+        """
+        Sends a personalized email over the shared SMTP session.
+
+        Args:
+            recipient_email (str): The prospect's email address.
+            subject (str): The email subject line.
+            body (str): The email content.
+
+        Returns:
+            bool: True if the email was sent successfully, False otherwise.
+        """
+        # --- Input Validation ---
+        if not all([SENDER_EMAIL, SENDER_APP_PASSWORD]):
+            logger.error("  [DISPATCH] Error: SENDER_EMAIL or SENDER_APP_PASSWORD env variables not set.")
+            return False
+
+        if not all([recipient_email, subject, body]):
+            logger.error("  [DISPATCH] Error: Missing recipient, subject, or body. Cannot send email.")
+            return False
+
+        msg = _build_message(recipient_email, subject, body)
+
+        logger.info("  [DISPATCH] Preparing to send email to '%s' via Google SMTP...", recipient_email)
+
+        def _send():
+            server = self._ensure_connection()
             server.send_message(msg)
-            print("    -> Email sent successfully.")
+
+        try:
+            # A transient failure (4xx, disconnect, timeout) is retried with
+            # backoff; a mid-send disconnect forces a reconnect on retry.
+            _retry(_send)
+            self._sent_on_session += 1
+            logger.debug("    -> Email sent successfully.")
             return True
-            
-    except smtplib.SMTPAuthenticationError:
-        print("    [ERROR] SMTP Authentication Failed. Verify your SENDER_EMAIL and ensure you are using a valid 16-digit App Password, not your regular password.")
-        return False
-    except Exception as e:
-        print(f"    [ERROR] An unexpected error occurred while sending email: {e}")
-        return False
+
+        except smtplib.SMTPAuthenticationError:
+            logger.error("    [ERROR] SMTP Authentication Failed. Verify your SENDER_EMAIL and ensure you are using a valid 16-digit App Password, not your regular password.")
+            return False
+        except Exception as e:
+            logger.error("    [ERROR] An unexpected error occurred while sending email: %s", e)
+            # Don't reuse a connection in an unknown state.
+            self.close()
+            return False
+
+
+# --- Bulk Dispatch ---
+
+def dispatch_bulk(messages, pool_size: int = 5):
+    """
+    Sends a batch of emails concurrently over a bounded pool of
+    pre-authenticated SMTP_SSL connections. SMTP is a sequential protocol,
+    so throughput comes from multiple concurrent sessions, not pipelining
+    a single one.
+
+    Args:
+        messages (list[tuple[str, str, str]]): (recipient, subject, body) triples.
+        pool_size (int): Number of concurrent SMTP connections (5-10 is sane).
+
+    Returns:
+        list[bool]: Per-message success flags, in input order.
+    """
+    if not messages:
+        return []
+    if not all([SENDER_EMAIL, SENDER_APP_PASSWORD]):
+        logger.error("  [DISPATCH] Error: SENDER_EMAIL or SENDER_APP_PASSWORD env variables not set.")
+        return [False] * len(messages)
+
+    pool_size = min(pool_size, len(messages))
+    pool = queue.Queue()
+    for _ in range(pool_size):
+        pool.put(SMTPDispatcher())
+
+    def _send_one(message):
+        recipient_email, subject, body = message
+        dispatcher = pool.get()
+        try:
+            # Each dispatcher rotates its own session before the provider's
+            # per-session cap, so no extra bookkeeping is needed here.
+            return dispatcher.send_email(recipient_email, subject, body)
+        finally:
+            pool.put(dispatcher)
+
+    try:
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            results = list(executor.map(_send_one, messages))
+    finally:
+        while not pool.empty():
+            pool.get_nowait().close()
+
+    logger.info("  [DISPATCH] Bulk dispatch complete: %s/%s sent.", sum(results), len(messages))
+    return results
+
+
+# --- Module-Level Convenience Wrapper ---
+# Existing callers (main.py / main_alt.py) import dispatch and call
+# send_email() directly; route them through one shared dispatcher so they
+# also benefit from session reuse.
+
+_default_dispatcher = SMTPDispatcher()
+
+def send_email(recipient_email: str, subject: str, body: str):
+    """
+    Sends a single email via the shared module-level SMTPDispatcher.
+
+    Args:
+        recipient_email (str): The prospect's email address.
+        subject (str): The email subject line.
+        body (str): The email content.
+
+    Returns:
+        bool: True if the email was sent successfully, False otherwise.
+    """
+    return _default_dispatcher.send_email(recipient_email, subject, body)
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     print("--- Running Dispatch Module Standalone Test ---")
     
     test_recipient = os.environ.get('TEST_RECIPIENT_EMAIL')
@@ -1,20 +1,39 @@
 # enrichment.py
 # Module 2: Gathers deterministic OSINT data for a given lead.
 # v4_2025-08-18: Enhanced with Gemini AI industry detection and comprehensive search strategies
+# v5_2025-08-31: Concurrent search fan-out via asyncio.gather; round trips overlap instead of serializing
 
 import os
 import json
-import pandas as pd
-from time import sleep
-import random
+import asyncio
+import datetime
+import functools
+import hashlib
+import logging
+import requests
+from collections import Counter
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter, Retry
 import google.generativeai as genai
 
+# Lazy %-style logging: per-query/per-result lines use logger.debug with %s
+# interpolation, so bulk runs at INFO never pay to format them.
+logger = logging.getLogger(__name__)
+
 # --- Dependencies ---
 # This module requires the following packages:
 # pip install duckduckgo-search googlesearch-python google-generativeai
 from duckduckgo_search import DDGS
 from googlesearch import search as google_search
 
+# Optional: a Redis-backed search cache shared across processes/runs.
+# pip install redis and set REDIS_URL to enable it; without it the
+# in-process lru_cache below still dedupes within a run.
+try:
+    import redis
+except ImportError:
+    redis = None
+
 # --- Gemini AI Configuration ---
 try:
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
@@ -22,328 +41,669 @@ try:
         raise ValueError("GEMINI_API_KEY environment variable not found.")
     genai.configure(api_key=GEMINI_API_KEY)
     gemini_model = genai.GenerativeModel('gemini-2.5-pro')
-    print("Gemini API configured successfully with 'gemini-2.5-pro' for industry detection.")
+    logger.info("Gemini API configured successfully with 'gemini-2.5-pro' for industry detection.")
 except Exception as e:
-    print(f"Error configuring Gemini API: {e}")
+    logger.error("Error configuring Gemini API: %s", e)
     gemini_model = None
 
+# --- Concurrent Search Helpers ---
+
+# Cap on simultaneous in-flight searches: high enough to overlap network
+# round trips, low enough to stay polite with the search engines.
+_SEARCH_CONCURRENCY = 4
+
+# A query counts as satisfied once DuckDuckGo returns this many hits; the
+# Google fallback (a whole extra round trip) only runs below this threshold.
+MIN_RESULTS_PER_QUERY = 3
+
+# Sustained per-provider request rates the engines tolerate comfortably.
+_DDG_RATE_PER_SEC = 2.0
+_GOOGLE_RATE_PER_SEC = 1.0
+
+class _RateLimiter:
+    """
+    Minimal async token bucket: at most max_rate acquisitions per
+    time_period, shared by every task on one event loop. Unlike the old
+    uniform random sleep between engines, it never over-waits when the
+    provider is quiet and never bursts when many queries are in flight.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self._interval = time_period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+# Shared HTTP session with a connection pool: sockets and TLS sessions are
+# reused across queries and leads instead of paying a fresh handshake
+# (~100-300ms) per request. Sized for the concurrent search fan-out.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+# --- Shared Search Cache (optional Redis layer) ---
+# Leads at the same company or in the same industry re-issue identical
+# queries; a shared cache turns the second+ occurrence into a sub-ms GET
+# instead of a full search round trip.
+
+_SEARCH_CACHE_TTL = 86400  # One day: search results are not that fresh anyway.
+_CACHE_COUNTERS = Counter()
+
+_redis_client = None
+if redis is not None and os.environ.get('REDIS_URL'):
+    try:
+        _redis_client = redis.Redis.from_url(
+            os.environ['REDIS_URL'],
+            max_connections=10,
+            decode_responses=True,
+        )
+        _redis_client.ping()
+        logger.info("Search cache: Redis connected.")
+    except Exception as e:
+        logger.warning("Search cache: Redis unavailable (%s); continuing without it.", e)
+        _redis_client = None
+
+def _cache_key(provider: str, query: str) -> str:
+    """Stable cache key: provider + query normalized to lowercase, single spaces."""
+    normalized = ' '.join(query.lower().split())
+    return 'search:' + hashlib.sha256(f'{provider}:{normalized}'.encode()).hexdigest()
+
+def _cache_get(provider: str, query: str):
+    """Returns the cached result list for a query, or None on miss/no cache."""
+    if _redis_client is None:
+        return None
+    try:
+        payload = _redis_client.get(_cache_key(provider, query))
+    except Exception:
+        return None
+    if payload is None:
+        _CACHE_COUNTERS['miss'] += 1
+        return None
+    _CACHE_COUNTERS['hit'] += 1
+    return json.loads(payload)
+
+def _cache_set(provider: str, query: str, results):
+    """Stores a query's results with a TTL; failures are non-fatal."""
+    if _redis_client is None:
+        return
+    try:
+        _redis_client.setex(_cache_key(provider, query), _SEARCH_CACHE_TTL, json.dumps(results))
+    except Exception:
+        pass
+
+@functools.lru_cache(maxsize=1024)
+def _ddg_search_sync(query: str, max_results: int):
+    """
+    Blocking DuckDuckGo text search for a single query.
+    Cached, since the query generators emit overlapping company-profile
+    queries across phases; returns (title, link, snippet) tuples so the
+    result is hashable for lru_cache.
+    """
+    cached = _cache_get('ddg', query)
+    if cached is not None:
+        return tuple(tuple(hit) for hit in cached)
+    with DDGS() as ddgs:
+        results = tuple(
+            (r.get('title', 'N/A'), r.get('href', 'N/A'), r.get('body', 'N/A'))
+            for r in ddgs.text(query, max_results=max_results)
+        )
+    _cache_set('ddg', query, results)
+    return results
+
+# Google Programmable Search JSON API credentials (optional). When set, we
+# hit the JSON API directly instead of the googlesearch scraper, which
+# embeds its own sleep_interval between paginated requests.
+GOOGLE_CSE_API_KEY = os.environ.get('GOOGLE_CSE_API_KEY')
+GOOGLE_CSE_CX = os.environ.get('GOOGLE_CSE_CX')
+
+@functools.lru_cache(maxsize=1024)
+def _google_search_sync(query: str, num_results: int):
+    """
+    Blocking Google search for a single query, returning a tuple of URLs. Cached.
+
+    Prefers the Programmable Search JSON API when configured (single HTTP
+    round trip, no scraper sleeps); otherwise falls back to the
+    googlesearch scraper with its embedded pagination sleep disabled —
+    pacing is already handled by the async search pipeline.
+    """
+    cached = _cache_get('google', query)
+    if cached is not None:
+        return tuple(cached)
+
+    if GOOGLE_CSE_API_KEY and GOOGLE_CSE_CX:
+        response = _HTTP_SESSION.get(
+            "https://www.googleapis.com/customsearch/v1",
+            params={
+                "key": GOOGLE_CSE_API_KEY,
+                "cx": GOOGLE_CSE_CX,
+                "q": query,
+                "num": min(num_results, 10),
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        results = tuple(item.get("link", "") for item in response.json().get("items", []))
+    else:
+        results = tuple(google_search(query, num_results=num_results, sleep_interval=0))
+
+    _cache_set('google', query, results)
+    return results
+
+@dataclass(slots=True)
+class SearchHit:
+    """
+    One search result. A slots instance is lighter than a 7-key dict in the
+    hot collection loop; the rest of the pipeline (Gemini prompts, sheet
+    JSON) consumes plain dicts, so hits are materialized via to_dict() once
+    at the search-runner boundary.
+    """
+    source: str
+    query: str
+    title: str
+    link: str
+    snippet: str
+    timestamp: str
+    search_type: str
+
+    def to_dict(self):
+        return {
+            "source": self.source,
+            "query": self.query,
+            "title": self.title,
+            "link": self.link,
+            "snippet": self.snippet,
+            "timestamp": self.timestamp,
+            "search_type": self.search_type,
+        }
+
+def _batch_timestamp() -> str:
+    """One ISO timestamp per search batch — results from the same batch are
+    semantically simultaneous, so per-result clock reads were pure waste."""
+    return datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')
+
+async def _search_one_query(query: str, max_results: int, google_results: int, search_type: str, semaphore,
+                            google_fallback: bool = True, batch_timestamp: str = None,
+                            ddg_limiter: _RateLimiter = None, google_limiter: _RateLimiter = None):
+    """
+    Runs DuckDuckGo (with Google as backup) for one query in worker threads.
+
+    Returns:
+        tuple: (list of SearchHit, number of engine searches that succeeded)
+    """
+    results = []
+    engines_succeeded = 0
+    if batch_timestamp is None:
+        batch_timestamp = _batch_timestamp()
+    async with semaphore:
+        # Try DuckDuckGo first (more reliable)
+        ddg_saturated = False
+        try:
+            if ddg_limiter is not None:
+                await ddg_limiter.acquire()
+            ddgs_results = await asyncio.to_thread(_ddg_search_sync, query, max_results)
+            for title, link, snippet in ddgs_results:
+                results.append(SearchHit("DuckDuckGo", query, title, link, snippet,
+                                         batch_timestamp, search_type))
+            # A search only counts as successful if it actually produced results.
+            if ddgs_results:
+                engines_succeeded += 1
+            ddg_saturated = len(ddgs_results) >= min(max_results, MIN_RESULTS_PER_QUERY)
+        except Exception as e:
+            logger.warning("        [WARN] DuckDuckGo failed for '%s': %s", query, e)
+
+        # Try Google as backup — but only when DuckDuckGo didn't already
+        # return enough; skipping the fallback saves a whole round trip per
+        # query on the common path. Callers can disable it outright for
+        # queries where sparse results are expected and fine.
+        if google_fallback and not ddg_saturated:
+            try:
+                if google_limiter is not None:
+                    await google_limiter.acquire()
+                google_urls = await asyncio.to_thread(_google_search_sync, query, google_results)
+                for url in google_urls:
+                    results.append(SearchHit("Google", query, "N/A (Google search)", url,
+                                             "N/A (Google search)", batch_timestamp, search_type))
+                if google_urls:
+                    engines_succeeded += 1
+            except Exception as e:
+                logger.warning("        [WARN] Google search failed for '%s': %s", query, e)
+
+    return results, engines_succeeded
+
+def run_search_queries(queries, max_results: int = 5, google_results: int = 3, search_type: str = "general",
+                       sufficient_results: int = None, google_fallback: bool = True):
+    """
+    Fans a list of queries out concurrently via asyncio, bounded by
+    _SEARCH_CONCURRENCY. Network round trips overlap instead of paying a
+    sleep + RTT per query serially.
+
+    Args:
+        queries: Search query strings (duplicates are dropped).
+        max_results: DuckDuckGo results per query.
+        google_results: Google results per query.
+        search_type: Tag stored on each result dict.
+        sufficient_results: Optional early-exit threshold — once this many
+            results are collected, still-pending queries are cancelled.
+        google_fallback: Pass False to skip the Google backup searches even
+            when DuckDuckGo comes back sparse.
+
+    Returns:
+        tuple: (flat list of result dicts, count of successful engine searches)
+    """
+    # Deduplicate while preserving order; the query generators emit
+    # overlapping queries across categories.
+    queries = list(dict.fromkeys(queries))
+
+    async def _gather():
+        semaphore = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+        # Limiters are loop-bound, so they're created per gather; pacing only
+        # matters while this batch's tasks are actually in flight.
+        ddg_limiter = _RateLimiter(_DDG_RATE_PER_SEC)
+        google_limiter = _RateLimiter(_GOOGLE_RATE_PER_SEC)
+        timestamp = _batch_timestamp()
+        tasks = [
+            asyncio.create_task(_search_one_query(q, max_results, google_results, search_type, semaphore,
+                                                  google_fallback, timestamp,
+                                                  ddg_limiter, google_limiter))
+            for q in queries
+        ]
+        gathered = []
+        collected = 0
+        for task in asyncio.as_completed(tasks):
+            gathered.append(await task)
+            collected += len(gathered[-1][0])
+            if sufficient_results is not None and collected >= sufficient_results:
+                # Enough signal already; skip the remaining round trips.
+                for pending in tasks:
+                    pending.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                break
+        return gathered
+
+    all_results = []
+    successful_searches = 0
+    for results, engines_succeeded in asyncio.run(_gather()):
+        all_results.extend(hit.to_dict() for hit in results)
+        successful_searches += engines_succeeded
+    return all_results, successful_searches
+
+def run_search_query_groups(query_groups, max_results: int = 5, google_results: int = 3,
+                            search_type: str = "general"):
+    """
+    Runs several named groups of queries inside a single event loop, so the
+    whole research pass completes in roughly max(query latency) instead of
+    paying each group's round trips back to back.
+
+    Args:
+        query_groups: Mapping of group key -> list of query strings.
+        max_results: DuckDuckGo results per query.
+        google_results: Google results per query.
+        search_type: Tag stored on each result dict.
+
+    Returns:
+        tuple: (dict of group key -> flat list of result dicts,
+                count of successful engine searches across all groups)
+    """
+    async def _gather():
+        semaphore = asyncio.Semaphore(_SEARCH_CONCURRENCY)
+
+        # Map each unique query to every group that asked for it: overlapping
+        # queries across categories (e.g. '"{c}" funding' appearing in both
+        # news and financials) hit the network exactly once, and the shared
+        # results fan back out to each requesting group.
+        query_to_keys = {}
+        for key, queries in query_groups.items():
+            for query in dict.fromkeys(queries):
+                query_to_keys.setdefault(query, []).append(key)
+
+        ddg_limiter = _RateLimiter(_DDG_RATE_PER_SEC)
+        google_limiter = _RateLimiter(_GOOGLE_RATE_PER_SEC)
+        timestamp = _batch_timestamp()
+        tasks = {
+            query: asyncio.create_task(_search_one_query(query, max_results, google_results, search_type, semaphore,
+                                                         batch_timestamp=timestamp,
+                                                         ddg_limiter=ddg_limiter, google_limiter=google_limiter))
+            for query in query_to_keys
+        }
+
+        grouped = {key: [] for key in query_groups}
+        successes = 0
+        for query, task in tasks.items():
+            results, engines_succeeded = await task
+            successes += engines_succeeded
+            for key in query_to_keys[query]:
+                grouped[key].extend(hit.to_dict() for hit in results)
+        return grouped, successes
+
+    return asyncio.run(_gather())
+
 # --- Enhanced Search Queries ---
 
+# Query templates hoisted to module scope: generate_search_queries runs once
+# per prospect and the structure only varies in the interpolated names
+# ({c}=company, {p}=prospect, {i}=industry).
+_COMPANY_QUERY_TEMPLATES = {
+    "company_overview": (
+        '"{c}" company profile',
+        '"{c}" about us',
+        '"{c}" company overview',
+        '"{c}" business description'
+    ),
+    "company_news": (
+        '"{c}" news',
+        '"{c}" press release',
+        '"{c}" announcement',
+        '"{c}" funding round',
+        '"{c}" expansion',
+        '"{c}" acquisition',
+        '"{c}" partnership'
+    ),
+    "company_financials": (
+        '"{c}" revenue',
+        '"{c}" funding',
+        '"{c}" investment',
+        '"{c}" financial results',
+        '"{c}" annual report'
+    )
+}
+
+_INDUSTRY_QUERY_TEMPLATES = {
+    "industry_trends": (
+        '"{i}" industry trends 2025',
+        '"{i}" market analysis',
+        '"{i}" growth opportunities',
+        '"{i}" challenges'
+    ),
+    "industry_funding": (
+        '"{i}" funding trends',
+        '"{i}" investment opportunities',
+        '"{i}" capital needs'
+    )
+}
+
+_PROSPECT_QUERY_TEMPLATES = {
+    "prospect_role": (
+        '"{p}" "{c}" title role',
+        '"{p}" "{c}" linkedin',
+        '"{p}" "{c}" position',
+        '"{p}" "{c}" executive'
+    ),
+    "prospect_background": (
+        '"{p}" professional background',
+        '"{p}" career history',
+        '"{p}" business experience'
+    )
+}
+
+_COMPETITIVE_QUERY_TEMPLATES = {
+    "competitors": (
+        '"{c}" competitors',
+        '"{c}" vs competitors',
+        '"{c}" market position'
+    ),
+    "market_opportunity": (
+        '"{c}" growth opportunities',
+        '"{c}" market expansion',
+        '"{c}" new markets'
+    )
+}
+
+def _format_queries(templates, **values):
+    """Formats a dict of query-template tuples into lists of concrete queries."""
+    return {
+        query_type: [tpl.format(**values) for tpl in tpls]
+        for query_type, tpls in templates.items()
+    }
+
 def generate_search_queries(company_name: str, prospect_name: str, industry: str = None):
     """
     Generates comprehensive search queries for different types of intelligence.
-    
+
     Args:
         company_name: The target company name
         prospect_name: The target prospect name
         industry: The industry the company operates in
-    
+
     Returns:
         dict: Organized search queries by category
     """
-    
-    # Basic company information
-    company_queries = {
-        "company_overview": [
-            f'"{company_name}" company profile',
-            f'"{company_name}" about us',
-            f'"{company_name}" company overview',
-            f'"{company_name}" business description'
-        ],
-        "company_news": [
-            f'"{company_name}" news',
-            f'"{company_name}" press release',
-            f'"{company_name}" announcement',
-            f'"{company_name}" funding round',
-            f'"{company_name}" expansion',
-            f'"{company_name}" acquisition',
-            f'"{company_name}" partnership'
-        ],
-        "company_financials": [
-            f'"{company_name}" revenue',
-            f'"{company_name}" funding',
-            f'"{company_name}" investment',
-            f'"{company_name}" financial results',
-            f'"{company_name}" annual report'
-        ]
-    }
-    
-    # Industry-specific research
-    industry_queries = {}
-    if industry:
-        industry_queries = {
-            "industry_trends": [
-                f'"{industry}" industry trends 2025',
-                f'"{industry}" market analysis',
-                f'"{industry}" growth opportunities',
-                f'"{industry}" challenges'
-            ],
-            "industry_funding": [
-                f'"{industry}" funding trends',
-                f'"{industry}" investment opportunities',
-                f'"{industry}" capital needs'
-            ]
-        }
-    
-    # Prospect-specific research
-    prospect_queries = {
-        "prospect_role": [
-            f'"{prospect_name}" "{company_name}" title role',
-            f'"{prospect_name}" "{company_name}" linkedin',
-            f'"{prospect_name}" "{company_name}" position',
-            f'"{prospect_name}" "{company_name}" executive'
-        ],
-        "prospect_background": [
-            f'"{prospect_name}" professional background',
-            f'"{prospect_name}" career history',
-            f'"{prospect_name}" business experience'
-        ]
-    }
-    
-    # Competitive intelligence
-    competitive_queries = {
-        "competitors": [
-            f'"{company_name}" competitors',
-            f'"{company_name}" vs competitors',
-            f'"{company_name}" market position'
-        ],
-        "market_opportunity": [
-            f'"{company_name}" growth opportunities',
-            f'"{company_name}" market expansion',
-            f'"{company_name}" new markets'
-        ]
-    }
-    
     return {
-        "company": company_queries,
-        "industry": industry_queries,
-        "prospect": prospect_queries,
-        "competitive": competitive_queries
+        "company": _format_queries(_COMPANY_QUERY_TEMPLATES, c=company_name),
+        "industry": _format_queries(_INDUSTRY_QUERY_TEMPLATES, i=industry) if industry else {},
+        "prospect": _format_queries(_PROSPECT_QUERY_TEMPLATES, c=company_name, p=prospect_name),
+        "competitive": _format_queries(_COMPETITIVE_QUERY_TEMPLATES, c=company_name)
     }
 
 # --- Industry Detection with Gemini AI ---
 
+# Industry detection needs keywords, not full articles: truncating snippets
+# and capping the overall context keeps prompts small, responses fast, and
+# token cost low.
+_SNIPPET_CHAR_LIMIT = 200
+_RESULTS_TEXT_CHAR_LIMIT = 8000
+
+@functools.lru_cache(maxsize=256)
+def _detect_industry_cached(company_name: str, results_text: str):
+    """
+    Issues the Gemini industry-detection call. Cached: repeated prospects at
+    the same company produce identical (company, context) inputs.
+    """
+    prompt = f"""
+    Analyze the following search results for the company "{company_name}" and determine their primary industry.
+
+    Search Results:
+    {results_text}
+
+    Instructions:
+    1. Review all the search results carefully
+    2. Look for industry indicators in company descriptions, news articles, and business information
+    3. Identify the primary industry this company operates in
+    4. Return ONLY the industry name (e.g., "Technology", "Healthcare", "Manufacturing", "Retail", "Financial Services")
+    5. If you cannot determine the industry from the results, return "Unknown"
+    6. Be specific but concise (e.g., "Software Development" not just "Technology")
+
+    Industry:"""
+
+    response = gemini_model.generate_content(prompt)
+    return response.text.strip()
+
 def detect_industry_with_gemini(company_name: str, search_results: list):
     """
     Uses Gemini AI to analyze search results and determine the company's industry.
-    
+
     Args:
         company_name: The company name to analyze
         search_results: List of search results to analyze
-    
+
     Returns:
         str: Detected industry or "Unknown"
     """
     if not gemini_model:
         return "Unknown (Gemini not configured)"
-    
+
     try:
-        # Prepare search results for analysis
-        results_text = ""
-        for i, result in enumerate(search_results[:30], 1):  # Analyze first 30 results
-            title = result.get('title', 'N/A')
-            snippet = result.get('snippet', 'N/A')
-            link = result.get('link', 'N/A')
-            results_text += f"Result {i}:\nTitle: {title}\nSnippet: {snippet}\nLink: {link}\n\n"
-        
-        # Create prompt for Gemini
-        prompt = f"""
-        Analyze the following search results for the company "{company_name}" and determine their primary industry.
+        # Prepare search results for analysis: single join instead of
+        # repeated string concatenation, truncated to a bounded budget.
+        results_text = "\n\n".join(
+            f"Result {i}:\n"
+            f"Title: {result.get('title', 'N/A')}\n"
+            f"Snippet: {str(result.get('snippet', 'N/A'))[:_SNIPPET_CHAR_LIMIT]}\n"
+            f"Link: {result.get('link', 'N/A')}"
+            for i, result in enumerate(search_results[:30], 1)  # Analyze first 30 results
+        )[:_RESULTS_TEXT_CHAR_LIMIT]
 
-        Search Results:
-        {results_text}
+        detected_industry = _detect_industry_cached(company_name, results_text)
 
-        Instructions:
-        1. Review all the search results carefully
-        2. Look for industry indicators in company descriptions, news articles, and business information
-        3. Identify the primary industry this company operates in
-        4. Return ONLY the industry name (e.g., "Technology", "Healthcare", "Manufacturing", "Retail", "Financial Services")
-        5. If you cannot determine the industry from the results, return "Unknown"
-        6. Be specific but concise (e.g., "Software Development" not just "Technology")
+        logger.debug("    -> Gemini AI detected industry: %s", detected_industry)
+        return detected_industry
 
-        Industry:"""
+    except Exception as e:
+        logger.warning("    -> [WARN] Gemini industry detection failed: %s", e)
+        return "Unknown (Analysis failed)"
+
+# Constant query suffixes for industry detection, hoisted to module scope so
+# per-prospect calls only pay for the f-string interpolation.
+_INDUSTRY_BASE_QUERIES = (
+    ' company profile',
+    ' about us',
+    ' business description',
+    ' what we do',
+    ' services',
+    ' products',
+    ' industry sector'
+)
+
+def _build_industry_queries(company_name: str, prospect_phone: str = None, prospect_email: str = None):
+    """Builds the shared industry-detection query list for a company."""
+    industry_queries = [f'"{company_name}"{suffix}' for suffix in _INDUSTRY_BASE_QUERIES]
+
+    # Add phone-based search if available
+    if prospect_phone:
+        industry_queries.append(f'"{company_name}" "{prospect_phone}"')
+
+    # Add email domain search if available
+    if prospect_email and '@' in prospect_email:
+        email_domain = prospect_email.split('@')[1]
+        industry_queries.append(f'"{company_name}" "{email_domain}"')
+
+    return industry_queries
+
+def detect_industries_batch(batches):
+    """
+    Classifies many companies' industries in a single Gemini call, amortizing
+    the API round trip across a batch instead of paying it per company.
+
+    Args:
+        batches: List of (company_name, search_results) tuples, where
+            search_results is the same list shape detect_industry_with_gemini
+            accepts. Keep batches to ~10 companies so the prompt stays small.
+
+    Returns:
+        dict: {company_name: detected_industry}. Companies the model could
+            not classify map to "Unknown".
+    """
+    if not gemini_model:
+        return {company_name: "Unknown (Gemini not configured)" for company_name, _ in batches}
+    if not batches:
+        return {}
+
+    try:
+        sections = []
+        for company_name, search_results in batches:
+            context = "\n".join(
+                f"- {result.get('title', 'N/A')}: {str(result.get('snippet', 'N/A'))[:_SNIPPET_CHAR_LIMIT]}"
+                for result in search_results[:10]
+            )
+            sections.append(f'Company: "{company_name}"\n{context}')
+
+        prompt = f"""
+    Determine the primary industry of each company below from its search results.
+
+    {chr(10).join(sections)}
+
+    Instructions:
+    1. For each company, return exactly one line of the form `<company name>: <industry>`
+    2. Use specific but concise industry names (e.g., "Software Development" not just "Technology")
+    3. If you cannot determine a company's industry, use "Unknown"
+    4. Return ONLY those lines, one per company, with no other text
+    """
 
-        # Get Gemini's analysis
         response = gemini_model.generate_content(prompt)
-        detected_industry = response.text.strip()
-        
-        print(f"    -> Gemini AI detected industry: {detected_industry}")
-        return detected_industry
-        
+
+        detected = {company_name: "Unknown" for company_name, _ in batches}
+        for line in response.text.strip().splitlines():
+            name, _, industry = line.partition(':')
+            name = name.strip().strip('"')
+            if name in detected and industry.strip():
+                detected[name] = industry.strip()
+
+        logger.debug("    -> Gemini AI detected industries for %s companies in one call", len(batches))
+        return detected
+
     except Exception as e:
-        print(f"    -> [WARN] Gemini industry detection failed: {e}")
-        return "Unknown (Analysis failed)"
+        logger.warning("    -> [WARN] Batch Gemini industry detection failed: %s", e)
+        return {company_name: "Unknown (Analysis failed)" for company_name, _ in batches}
 
-def perform_industry_detection_search(company_name: str, prospect_phone: str = None, prospect_email: str = None):
+def perform_industry_detection_search(company_name: str, prospect_phone: str = None, prospect_email: str = None,
+                                      max_results: int = 5, google_results: int = 3):
     """
     Performs targeted searches to gather information for industry detection.
-    
+
     Args:
         company_name: The company name
         prospect_phone: Phone number (optional)
         prospect_email: Email domain (optional)
-    
+        max_results: DuckDuckGo results per query
+        google_results: Google results per query
+
     Returns:
         list: Search results for industry analysis
     """
-    print(f"    -> Performing industry detection search for: {company_name}")
-    
-    # Generate industry detection queries
-    industry_queries = [
-        f'"{company_name}" company profile',
-        f'"{company_name}" about us',
-        f'"{company_name}" business description',
-        f'"{company_name}" what we do',
-        f'"{company_name}" services',
-        f'"{company_name}" products',
-        f'"{company_name}" industry sector'
-    ]
-    
-    # Add phone-based search if available
-    if prospect_phone:
-        industry_queries.append(f'"{company_name}" "{prospect_phone}"')
-    
-    # Add email domain search if available
-    if prospect_email and '@' in prospect_email:
-        email_domain = prospect_email.split('@')[1]
-        industry_queries.append(f'"{company_name}" "{email_domain}"')
-    
-    all_results = []
-    
-    for query in industry_queries:
-        print(f"      -> Industry detection query: {query}")
-        
-        # Add delay to avoid rate limiting
-        sleep(random.uniform(1.5, 2.5))
-        
-        # Try DuckDuckGo first
-        try:
-            with DDGS() as ddgs:
-                ddgs_results = list(ddgs.text(query, max_results=5))
-                for result in ddgs_results:
-                    all_results.append({
-                        "source": "DuckDuckGo",
-                        "query": query,
-                        "title": result.get('title', 'N/A'),
-                        "link": result.get('href', 'N/A'),
-                        "snippet": result.get('body', 'N/A')
-                    })
-        except Exception as e:
-            print(f"        [WARN] DuckDuckGo failed for industry detection: {e}")
-        
-        # Try Google as backup
-        try:
-            sleep(random.uniform(2.0, 3.0))
-            google_results_gen = google_search(query, num_results=3, sleep_interval=2)
-            for url in google_results_gen:
-                all_results.append({
-                    "source": "Google",
-                    "query": query,
-                    "title": "N/A (Google search)",
-                    "link": url,
-                    "snippet": "N/A (Google search)"
-                })
-        except Exception as e:
-            print(f"        [WARN] Google search failed for industry detection: {e}")
-    
+    logger.debug("    -> Performing industry detection search for: %s", company_name)
+
+    industry_queries = _build_industry_queries(company_name, prospect_phone, prospect_email)
+
+    # Fan all queries out concurrently instead of sleeping between each one.
+    all_results, _ = run_search_queries(
+        industry_queries, max_results=max_results, google_results=google_results,
+        search_type="industry_detection"
+    )
     return all_results
 
 def perform_fast_industry_detection_search(company_name: str, prospect_phone: str = None, prospect_email: str = None):
     """
     Performs targeted searches to gather information for industry detection.
-    Optimized for speed, reduces delays and results.
-    
+    Same query set as perform_industry_detection_search (the two variants
+    previously duplicated it verbatim), tuned for more results per query.
+
     Args:
         company_name: The company name
         prospect_phone: Phone number (optional)
         prospect_email: Email domain (optional)
-    
+
     Returns:
         list: Search results for industry analysis
     """
-    print(f"    -> Performing FAST industry detection search for: {company_name}")
-    
-    # Reduced query set for speed
-    industry_queries = [
-        f'"{company_name}" company profile',
-        f'"{company_name}" about us',
-        f'"{company_name}" business description',
-        f'"{company_name}" what we do',
-        f'"{company_name}" services',
-        f'"{company_name}" products',
-        f'"{company_name}" industry sector'
-    ]
-    
-    # Add phone-based search if available
-    if prospect_phone:
-        industry_queries.append(f'"{company_name}" "{prospect_phone}"')
-    
-    # Add email domain search if available
-    if prospect_email and '@' in prospect_email:
-        email_domain = prospect_email.split('@')[1]
-        industry_queries.append(f'"{company_name}" "{email_domain}"')
-    
-    all_results = []
-    
-    for query in industry_queries:
-        print(f"      -> FAST industry detection query: {query}")
-        
-        # OPTIMIZED: Reduced delays for speed
-        delay = random.uniform(0.8, 1.2)  # Was 1.5-2.5
-        sleep(delay)
-        
-        # Try DuckDuckGo first (more reliable)
-        try:
-            with DDGS() as ddgs:
-                # OPTIMIZED: Reduced results for speed
-                ddgs_results = list(ddgs.text(query, max_results=6))  # Was 10
-                for result in ddgs_results:
-                    all_results.append({
-                        "source": "DuckDuckGo",
-                        "query": query,
-                        "title": result.get('title', 'N/A'),
-                        "link": result.get('href', 'N/A'),
-                        "snippet": result.get('body', 'N/A')
-                    })
-        except Exception as e:
-            print(f"        [WARN] DuckDuckGo failed for FAST industry detection: {e}")
-        
-        # Try Google as backup (OPTIMIZED: faster delays)
-        try:
-            sleep(random.uniform(1.0, 1.5))  # Was 2.0-3.0
-            google_results_gen = google_search(query, num_results=6, sleep_interval=1)  # Was 10, sleep_interval=2
-            google_results = list(google_results_gen)
-            for url in google_results:
-                all_results.append({
-                    "source": "Google",
-                    "query": query,
-                    "title": "N/A (Google search)",
-                    "link": url,
-                    "snippet": "N/A (Google search)"
-                })
-        except Exception as e:
-            print(f"        [WARN] Google search failed for FAST industry detection: {e}")
-    
-    return all_results
+    logger.debug("    -> Performing FAST industry detection search for: %s", company_name)
+    return perform_industry_detection_search(
+        company_name, prospect_phone, prospect_email, max_results=6, google_results=6
+    )
 
-def perform_enhanced_web_searches(company_name: str, prospect_name: str, industry: str = None, num_results: int = 5):
+def perform_enhanced_web_searches(company_name: str, prospect_name: str, industry: str = None, num_results: int = 5,
+                                  sufficient_prospect_results: int = 25):
     """
     Performs comprehensive web searches using multiple strategies and sources.
     OPTIMIZED FOR SPEED: Target completion within 90 seconds.
     NEW FLOW: Prospect searches first → Industry detection → Company research with context.
-    
+
     Args:
         company_name: The target company name
         prospect_name: The target prospect name
         industry: The industry the company operates in (optional, will be detected if not provided)
         num_results: Number of results per query
-    
+        sufficient_prospect_results: Stop issuing prospect queries early once
+            this many results are collected
+
     Returns:
         dict: Comprehensive intelligence report
     """
-    print(f"  [ENRICH] Starting OPTIMIZED web searches for '{prospect_name} at {company_name}'...")
-    print(f"  [ENRICH] Target completion time: 90 seconds")
+    logger.info("  [ENRICH] Starting OPTIMIZED web searches for '%s at %s'...", prospect_name, company_name)
+    logger.debug("  [ENRICH] Target completion time: 90 seconds")
     
+    # The report deliberately stays a plain dict-of-dicts: it gets
+    # json.dumps'd for the sheet, embedded verbatim in Gemini prompts, and
+    # consumed via .get by synthesis and both orchestrators, so a typed
+    # struct layer would only add a conversion pass at every boundary.
     intelligence_report = {
         "prospect_specific_intelligence": {},
         "company_intelligence": {},
@@ -362,10 +722,11 @@ def perform_enhanced_web_searches(company_name: str, prospect_name: str, industr
     
     total_queries = 0
     successful_searches = 0
-    
+    cache_counts_before = dict(_CACHE_COUNTERS)
+
     try:
         # --- PHASE 1: FAST Prospect-Specific Searches (Primary Strategy) ---
-        print("  [ENRICH] Phase 1: FAST prospect-specific searches (target: 45 seconds)...")
+        logger.debug("  [ENRICH] Phase 1: FAST prospect-specific searches (target: 45 seconds)...")
         
         # Reduced query set for speed - focus on most effective searches
         prospect_specific_queries = [
@@ -376,116 +737,40 @@ def perform_enhanced_web_searches(company_name: str, prospect_name: str, industr
             f'"{prospect_name}" "{company_name}" contact'
         ]
         
-        prospect_results = []
         prospect_results_found = False
-        
-        for query in prospect_specific_queries:
-            total_queries += 1
-            print(f"    -> FAST prospect query: {query}")
-            
-            # OPTIMIZED: Reduced delays for speed
-            delay = random.uniform(0.8, 1.2)  # Was 1.5-2.5
-            sleep(delay)
-            
-            # Try DuckDuckGo first (more reliable)
-            try:
-                with DDGS() as ddgs:
-                    # OPTIMIZED: Reduced results for speed
-                    ddgs_results = list(ddgs.text(query, max_results=20))  # Was 10
-                    for result in ddgs_results:
-                        prospect_results.append({
-                            "source": "DuckDuckGo",
-                            "query": query,
-                            "title": result.get('title', 'N/A'),
-                            "link": result.get('href', 'N/A'),
-                            "snippet": result.get('body', 'N/A'),
-                            "timestamp": pd.Timestamp.now().isoformat(),
-                            "search_type": "prospect_specific"
-                        })
-                    successful_searches += 1
-                    print(f"      -> Found {len(ddgs_results)} DuckDuckGo results")
-                    
-            except Exception as e:
-                print(f"        [WARN] DuckDuckGo failed for '{query}': {e}")
-            
-            # Try Google as backup (OPTIMIZED: faster delays)
-            try:
-                sleep(random.uniform(1.0, 1.5))  # Was 2.0-3.0
-                google_results_gen = google_search(query, num_results=20, sleep_interval=1)  # Was 10, sleep_interval=2
-                google_results = list(google_results_gen)
-                for url in google_results:
-                    prospect_results.append({
-                        "source": "Google",
-                        "query": query,
-                        "title": "N/A (Google search)",
-                        "link": url,
-                        "snippet": "N/A (Google search)",
-                        "timestamp": pd.Timestamp.now().isoformat(),
-                        "search_type": "prospect_specific"
-                    })
-                successful_searches += 1
-                print(f"      -> Found {len(google_results)} Google results")
-                
-            except Exception as e:
-                print(f"        [WARN] Google search failed for '{query}': {e}")
+
+        # OPTIMIZED: all prospect queries issued concurrently; no per-query sleeps.
+        logger.debug("    -> Running %s FAST prospect queries concurrently...", len(prospect_specific_queries))
+        total_queries += len(prospect_specific_queries)
+        prospect_results, phase1_successes = run_search_queries(
+            prospect_specific_queries, max_results=20, google_results=20,
+            search_type="prospect_specific",
+            sufficient_results=sufficient_prospect_results
+        )
+        successful_searches += phase1_successes
         
         # Check if we found prospect-specific results
         if prospect_results:
             prospect_results_found = True
             intelligence_report["search_metadata"]["prospect_results_found"] = True
-            print(f"  [ENRICH] ✅ Found {len(prospect_results)} prospect-specific results!")
+            logger.debug("  [ENRICH] ✅ Found %s prospect-specific results!", len(prospect_results))
             
             # OPTIMIZED: Only run additional searches if we have very few results
             if len(prospect_results) < 5:  # Was 10
-                print(f"  [ENRICH] ⚠️  Only found {len(prospect_results)} prospect results, running 2 additional queries...")
+                logger.debug("  [ENRICH] ⚠️  Only found %s prospect results, running 2 additional queries...", len(prospect_results))
                 # Reduced additional queries for speed
                 additional_queries = [
                     f'"{prospect_name}" "{company_name}" professional',
                     f'"{prospect_name}" "{company_name}" business'
                 ]
                 
-                for query in additional_queries:
-                    total_queries += 1
-                    print(f"    -> Additional FAST query: {query}")
-                    sleep(random.uniform(0.8, 1.2))  # OPTIMIZED: faster delays
-                    
-                    try:
-                        with DDGS() as ddgs:
-                            ddgs_results = list(ddgs.text(query, max_results=3))  # Was 5
-                            for result in ddgs_results:
-                                prospect_results.append({
-                                    "source": "DuckDuckGo",
-                                    "query": query,
-                                    "title": result.get('title', 'N/A'),
-                                    "link": result.get('href', 'N/A'),
-                                    "snippet": result.get('body', 'N/A'),
-                                    "timestamp": pd.Timestamp.now().isoformat(),
-                                    "search_type": "prospect_specific_additional"
-                                })
-                            successful_searches += 1
-                            
-                    except Exception as e:
-                        print(f"        [WARN] Additional DuckDuckGo search failed: {e}")
-                    
-                    # Try Google for additional queries too (OPTIMIZED: faster)
-                    try:
-                        sleep(random.uniform(1.0, 1.5))  # Was 2.0-3.0
-                        google_results_gen = google_search(query, num_results=3, sleep_interval=1)  # Was 5, sleep_interval=2
-                        google_results = list(google_results_gen)
-                        for url in google_results:
-                            prospect_results.append({
-                                "source": "Google",
-                                "query": query,
-                                "title": "N/A (Google search)",
-                                "link": url,
-                                "snippet": "N/A (Google search)",
-                                "timestamp": pd.Timestamp.now().isoformat(),
-                                "search_type": "prospect_specific_additional"
-                            })
-                        successful_searches += 1
-                        
-                    except Exception as e:
-                        print(f"        [WARN] Additional Google search failed: {e}")
+                total_queries += len(additional_queries)
+                additional_results, additional_successes = run_search_queries(
+                    additional_queries, max_results=3, google_results=3,
+                    search_type="prospect_specific_additional"
+                )
+                prospect_results.extend(additional_results)
+                successful_searches += additional_successes
             
             # Store prospect-specific results
             intelligence_report["prospect_specific_intelligence"] = {
@@ -494,33 +779,34 @@ def perform_enhanced_web_searches(company_name: str, prospect_name: str, industr
                 "search_strategy": "prospect_name_company_name_primary_optimized"
             }
             
-            print(f"  [ENRICH] ✅ Prospect intelligence complete: {len(prospect_results)} total results")
-            print(f"  [ENRICH] 📊 Prospect results breakdown:")
-            print(f"    -> Total results: {len(prospect_results)}")
-            print(f"    -> DuckDuckGo results: {len([r for r in prospect_results if r['source'] == 'DuckDuckGo'])}")
-            print(f"    -> Google results: {len([r for r in prospect_results if r['source'] == 'Google'])}")
+            source_counts = Counter(r['source'] for r in prospect_results)
+            logger.debug("  [ENRICH] ✅ Prospect intelligence complete: %s total results", len(prospect_results))
+            logger.debug("  [ENRICH] 📊 Prospect results breakdown:")
+            logger.debug("    -> Total results: %s", len(prospect_results))
+            logger.debug("    -> DuckDuckGo results: %s", source_counts['DuckDuckGo'])
+            logger.debug("    -> Google results: %s", source_counts['Google'])
         
         else:
-            print(f"  [ENRICH] ❌ No prospect-specific results found")
+            logger.debug("  [ENRICH] ❌ No prospect-specific results found")
         
         # --- PHASE 2: FAST Industry Detection from Prospect Results ---
-        print("  [ENRICH] Phase 2: FAST industry detection (target: 15 seconds)...")
+        logger.debug("  [ENRICH] Phase 2: FAST industry detection (target: 15 seconds)...")
         
         detected_industry = industry  # Use provided industry if available
         
         if not detected_industry and prospect_results:
-            print("  [ENRICH] Using prospect search results to detect industry...")
-            print(f"  [ENRICH] Analyzing {len(prospect_results)} prospect results for industry context...")
+            logger.debug("  [ENRICH] Using prospect search results to detect industry...")
+            logger.debug("  [ENRICH] Analyzing %s prospect results for industry context...", len(prospect_results))
             try:
                 detected_industry = detect_industry_with_gemini(company_name, prospect_results)
                 intelligence_report["search_metadata"]["industry_detected_from_prospect_results"] = True
-                print(f"  [ENRICH] ✅ Industry detected from prospect results: {detected_industry}")
+                logger.debug("  [ENRICH] ✅ Industry detected from prospect results: %s", detected_industry)
             except Exception as e:
-                print(f"  [ERROR] Industry detection from prospect results failed: {e}")
+                logger.error("  [ERROR] Industry detection from prospect results failed: %s", e)
                 detected_industry = "Unknown (Detection failed)"
         
         elif not detected_industry and not prospect_results:
-            print("  [ENRICH] No prospect results available, performing FAST basic industry detection...")
+            logger.debug("  [ENRICH] No prospect results available, performing FAST basic industry detection...")
             try:
                 # OPTIMIZED: Reduced industry detection queries for speed
                 industry_search_results = perform_fast_industry_detection_search(company_name)
@@ -528,16 +814,16 @@ def perform_enhanced_web_searches(company_name: str, prospect_name: str, industr
                     detected_industry = detect_industry_with_gemini(company_name, industry_search_results)
                 else:
                     detected_industry = "Unknown (No search results)"
-                print(f"  [ENRICH] Industry detection complete: {detected_industry}")
+                logger.debug("  [ENRICH] Industry detection complete: %s", detected_industry)
             except Exception as e:
-                print(f"  [ERROR] Basic industry detection failed: {e}")
+                logger.error("  [ERROR] Basic industry detection failed: %s", e)
                 detected_industry = "Unknown (Detection failed)"
         
         # Update the intelligence report with detected industry
         intelligence_report["search_metadata"]["industry"] = detected_industry
         
         # --- PHASE 3: FAST Company Research with Industry Context ---
-        print("  [ENRICH] Phase 3: FAST company research (target: 30 seconds)...")
+        logger.debug("  [ENRICH] Phase 3: FAST company research (target: 30 seconds)...")
         
         # Generate company search queries using detected industry
         all_queries = generate_search_queries(company_name, prospect_name, detected_industry)
@@ -545,90 +831,55 @@ def perform_enhanced_web_searches(company_name: str, prospect_name: str, industr
         # OPTIMIZED: Process only essential categories for speed
         essential_categories = ["company_overview", "industry_trends"]  # Focus on most important
         
+        research_groups = {}
         for category, query_groups in all_queries.items():
             if not query_groups:  # Skip empty industry queries
                 continue
-                
+
             intelligence_report[f"{category}_intelligence"] = {}
-            
+
             for query_type, queries in query_groups.items():
                 # OPTIMIZED: Skip non-essential queries for speed
                 if category == "industry" and query_type not in essential_categories:
                     continue
                 if category == "company" and query_type not in essential_categories:
                     continue
-                
-                print(f"    -> FAST researching {category}: {query_type}")
-                
-                category_results = []
-                
-                # OPTIMIZED: Process only first 2 queries per type for speed
-                for query in queries[:2]:  # Was processing all queries
-                    total_queries += 1
-                    print(f"      -> FAST query: {query}")
-                    
-                    # OPTIMIZED: Faster delays for speed
-                    delay = random.uniform(0.8, 1.5)  # Was 1.5-3.0
-                    sleep(delay)
-                    
-                    # Try DuckDuckGo first (more reliable)
-                    try:
-                        with DDGS() as ddgs:
-                            # OPTIMIZED: Reduced results for speed
-                            ddgs_results = list(ddgs.text(query, max_results=3))  # Was num_results (5)
-                            for result in ddgs_results:
-                                category_results.append({
-                                    "source": "DuckDuckGo",
-                                    "query": query,
-                                    "title": result.get('title', 'N/A'),
-                                    "link": result.get('href', 'N/A'),
-                                    "snippet": result.get('body', 'N/A'),
-                                    "timestamp": pd.Timestamp.now().isoformat(),
-                                    "search_type": "company_research"
-                                })
-                            successful_searches += 1
-                            
-                    except Exception as e:
-                        print(f"        [WARN] DuckDuckGo failed for '{query}': {e}")
-                    
-                    # Try Google as backup (OPTIMIZED: faster delays)
-                    try:
-                        sleep(random.uniform(1.0, 2.0))  # Was 2.0-4.0
-                        google_results_gen = google_search(query, num_results=3, sleep_interval=1)  # Was num_results, sleep_interval=2
-                        for url in google_results_gen:
-                            category_results.append({
-                                "source": "Google",
-                                "query": query,
-                                "title": "N/A (Google search)",
-                                "link": url,
-                                "snippet": "N/A (Google search)",
-                                "timestamp": pd.Timestamp.now().isoformat(),
-                                "search_type": "company_research"
-                            })
-                        successful_searches += 1
-                        
-                    except Exception as e:
-                        print(f"        [WARN] Google search failed for '{query}': {e}")
-                
-                # Store results for this query type
-                intelligence_report[f"{category}_intelligence"][query_type] = category_results
+
+                logger.debug("    -> FAST researching %s: %s", category, query_type)
+
+                # OPTIMIZED: Only the first 2 queries per type, for speed.
+                total_queries += len(queries[:2])
+                research_groups[(category, query_type)] = queries[:2]
+
+        # All research categories fan out through one event loop, so the whole
+        # phase costs roughly one query round trip instead of one per type.
+        grouped_results, research_successes = run_search_query_groups(
+            research_groups, max_results=3, google_results=3,
+            search_type="company_research"
+        )
+        successful_searches += research_successes
+
+        for (category, query_type), category_results in grouped_results.items():
+            intelligence_report[f"{category}_intelligence"][query_type] = category_results
         
         # Update metadata
         intelligence_report["search_metadata"]["total_queries"] = total_queries
         intelligence_report["search_metadata"]["successful_searches"] = successful_searches
+        intelligence_report["search_metadata"]["cache_hits"] = _CACHE_COUNTERS['hit'] - cache_counts_before.get('hit', 0)
+        intelligence_report["search_metadata"]["cache_misses"] = _CACHE_COUNTERS['miss'] - cache_counts_before.get('miss', 0)
         
-        print(f"  [ENRICH] ✅ FAST search completed: {total_queries} queries with {successful_searches} successful searches")
+        logger.info("  [ENRICH] ✅ FAST search completed: %s queries with %s successful searches", total_queries, successful_searches)
         
         if prospect_results_found:
-            print(f"  [ENRICH] 🎯 SUCCESS: Found prospect-specific intelligence with {len(prospect_results)} results")
-            print(f"  [ENRICH] 📊 Strategy: FAST Prospect + Company Name → Industry Detection → Company Research")
+            logger.debug("  [ENRICH] 🎯 SUCCESS: Found prospect-specific intelligence with %s results", len(prospect_results))
+            logger.debug("  [ENRICH] 📊 Strategy: FAST Prospect + Company Name → Industry Detection → Company Research")
         else:
-            print(f"  [ENRICH] 📊 Strategy: FAST Company Research Only (No prospect-specific results found)")
+            logger.debug("  [ENRICH] 📊 Strategy: FAST Company Research Only (No prospect-specific results found)")
         
         return intelligence_report
         
     except Exception as e:
-        print(f"  [ERROR] Critical error in perform_enhanced_web_searches: {e}")
+        logger.error("  [ERROR] Critical error in perform_enhanced_web_searches: %s", e)
         # Return partial results if available
         intelligence_report["error"] = str(e)
         intelligence_report["search_metadata"]["error"] = str(e)
@@ -636,13 +887,14 @@ def perform_enhanced_web_searches(company_name: str, prospect_name: str, industr
 
 # --- Enhanced Orchestrator Function ---
 
-def enrich_lead(lead_series: pd.Series):
+def enrich_lead(lead_series):
     """
     Orchestrates the enhanced enrichment process with integrated industry detection.
     NEW FLOW: Prospect searches → Industry detection → Company research with context.
     
     Args:
-        lead_series (pd.Series): A single row from the leads DataFrame.
+        lead_series: A single row from the leads DataFrame (any mapping
+            with a .get method works).
     
     Returns:
         dict: A comprehensive intelligence report with detected industry.
@@ -652,15 +904,15 @@ def enrich_lead(lead_series: pd.Series):
     prospect_phone = lead_series.get('Prospect_Phone', 'N/A')
     prospect_email = lead_series.get('Prospect_Email', 'N/A')
     
-    print(f"\n--- Enhanced Enrichment with Integrated Industry Detection for Lead: {prospect_name} at {company_name} ---")
+    logger.info("\n--- Enhanced Enrichment with Integrated Industry Detection for Lead: %s at %s ---", prospect_name, company_name)
     
     if prospect_name == 'N/A' or company_name == 'N/A':
-        print("  [ERROR] Lead is missing Prospect_Name or Company_Name. Skipping enrichment.")
+        logger.error("  [ERROR] Lead is missing Prospect_Name or Company_Name. Skipping enrichment.")
         return {"error": "Missing critical lead information."}
 
     try:
         # NEW FLOW: All-in-one enhanced search with integrated industry detection
-        print("  [ENRICH] Starting integrated enrichment process...")
+        logger.debug("  [ENRICH] Starting integrated enrichment process...")
         intelligence_report = perform_enhanced_web_searches(company_name, prospect_name)
         
         # Add lead metadata
@@ -670,7 +922,7 @@ def enrich_lead(lead_series: pd.Series):
             "detected_industry": intelligence_report["search_metadata"].get("industry", "Unknown"),
             "prospect_phone": prospect_phone,
             "prospect_email": prospect_email,
-            "enrichment_timestamp": pd.Timestamp.now().isoformat()
+            "enrichment_timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat()
         }
         
         # Add industry detection results
@@ -680,30 +932,30 @@ def enrich_lead(lead_series: pd.Series):
             "detected_from_prospect_results": intelligence_report["search_metadata"].get("industry_detected_from_prospect_results", False)
         }
         
-        print("--- Enhanced Enrichment with Integrated Industry Detection Complete ---")
-        print(f"  -> Detected Industry: {intelligence_report['search_metadata'].get('industry', 'Unknown')}")
+        logger.info("--- Enhanced Enrichment with Integrated Industry Detection Complete ---")
+        logger.debug("  -> Detected Industry: %s", intelligence_report['search_metadata'].get('industry', 'Unknown'))
         
         # Report on prospect-specific intelligence
         if intelligence_report.get("prospect_specific_intelligence"):
             prospect_data = intelligence_report["prospect_specific_intelligence"]
-            print(f"  -> 🎯 Prospect-specific intelligence: {prospect_data.get('total_results', 0)} results found")
-            print(f"  -> 📊 Search strategy: {prospect_data.get('search_strategy', 'Unknown')}")
+            logger.debug("  -> 🎯 Prospect-specific intelligence: %s results found", prospect_data.get('total_results', 0))
+            logger.debug("  -> 📊 Search strategy: %s", prospect_data.get('search_strategy', 'Unknown'))
         else:
-            print(f"  -> ❌ No prospect-specific intelligence found")
+            logger.debug("  -> ❌ No prospect-specific intelligence found")
         
         # Report on industry detection method
         if intelligence_report["search_metadata"].get("industry_detected_from_prospect_results"):
-            print(f"  -> 🎯 Industry detected from prospect search results")
+            logger.debug("  -> 🎯 Industry detected from prospect search results")
         else:
-            print(f"  -> 📊 Industry detected from basic company searches")
+            logger.debug("  -> 📊 Industry detected from basic company searches")
         
-        print(f"  -> Company intelligence: {len(intelligence_report.get('company_intelligence', {}))} categories")
-        print(f"  -> Industry intelligence: {len(intelligence_report.get('industry_intelligence', {}))} categories")
-        print(f"  -> Competitive intelligence: {len(intelligence_report.get('competitive_intelligence', {}))} categories")
+        logger.debug("  -> Company intelligence: %s categories", len(intelligence_report.get('company_intelligence', {})))
+        logger.debug("  -> Industry intelligence: %s categories", len(intelligence_report.get('industry_intelligence', {})))
+        logger.debug("  -> Competitive intelligence: %s categories", len(intelligence_report.get('competitive_intelligence', {})))
         
         return intelligence_report
 
     except Exception as e:
-        print(f"  [ERROR] An unexpected error occurred during enrichment: {e}")
+        logger.error("  [ERROR] An unexpected error occurred during enrichment: %s", e)
         return {"error": str(e)}
 
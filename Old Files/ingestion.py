@@ -72,19 +72,22 @@ def get_new_leads(gc: gspread.Client):
         spreadsheet = gc.open(sheet_name)
         worksheet = spreadsheet.sheet1
         
-        all_records = worksheet.get_all_records()
-        if not all_records:
+        # get_all_values is one API call returning a list of lists; building
+        # the DataFrame from it directly skips get_all_records' per-row dict
+        # construction, which is pure Python overhead on large sheets.
+        values = worksheet.get_all_values()
+        if len(values) < 2:
             print("Sheet is empty. No leads to process.")
             return pd.DataFrame()
 
-        df = pd.DataFrame(all_records)
+        df = pd.DataFrame(values[1:], columns=values[0])
         print(f"Successfully loaded {len(df)} total records from the sheet.")
 
         if 'Status' not in df.columns:
             print("Warning: 'Status' column not found. The pipeline may not be able to track progress.")
             return df
 
-        new_leads_df = df[df['Status'].isin(['', 'New', None])].copy()
+        new_leads_df = df[df['Status'].isin(['', 'New']) | df['Status'].isna()].copy()
         
         if not new_leads_df.empty:
             print(f"Found {len(new_leads_df)} new leads to process.")
@@ -2,10 +2,14 @@
 # An alternative orchestrator to test the enrichment_alt.py module.
 # v2_2025-08-20: Modified to call the new deep research module.
 
+import atexit
 import os
 import logging
 import json
-from time import sleep
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
 import gspread
 
 # Import individual modules of the pipeline
@@ -19,20 +23,31 @@ print("Script is starting...")
 
 # --- Logging & Directory Configuration ---
 def setup_logging():
-    """Ensures the 'logs' directory exists and configures logging."""
+    """Ensures the 'logs' directory exists and configures non-blocking logging."""
     log_dir = "logs"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
         print(f"Created directory: {log_dir}")
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(os.path.join(log_dir, "pipeline.log")),
-            logging.StreamHandler()
-        ]
-    )
+
+    # The pipeline threads only enqueue records; the QueueListener's own
+    # thread does the file/console writes, so disk and terminal I/O never
+    # block a lead mid-flight.
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(os.path.join(log_dir, "pipeline.log"))
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    # Flush any queued records when the process exits, whichever path it
+    # takes out of run_pipeline.
+    atexit.register(listener.stop)
 
 def get_user_approval(lead_info, email_content):
     """
@@ -63,15 +78,6 @@ def get_user_approval(lead_info, email_content):
         else:
             print("Invalid choice. Please enter 1 or 2.")
 
-def get_column_map(worksheet):
-    """Reads the header row and returns a dictionary mapping column names to indices."""
-    try:
-        headers = worksheet.row_values(1)
-        return {header: i + 1 for i, header in enumerate(headers)}
-    except Exception as e:
-        logging.error(f"Failed to read header row from sheet: {e}")
-        return None
-
 def run_pipeline():
     """Executes the full ingestion, enrichment, synthesis, and dispatch pipeline."""
     setup_logging()
@@ -105,7 +111,7 @@ def run_pipeline():
             batch_size = int(batch_size_str)
 
         # Slice the DataFrame to the requested batch size
-        leads_df = leads_df.head(batch_size)
+        leads_df = leads_df.iloc[:batch_size]
     except (ValueError, TypeError):
         logging.error("Invalid input. Please enter a number or 'all'. Exiting.")
         return
@@ -113,96 +119,150 @@ def run_pipeline():
     try:
         spreadsheet = gspread_client.open(config.GOOGLE_SHEET_NAME)
         worksheet = spreadsheet.sheet1
-        col_map = get_column_map(worksheet)
-        if not col_map or 'Status' not in col_map:
-            logging.critical("Could not find 'Status' column in the sheet. Halting.")
+        # The leads DataFrame already carries the header row from ingestion's
+        # get_all_values call, so the column map comes for free — no second
+        # header-read RPC against the sheet.
+        col_map = {header: i + 1 for i, header in enumerate(leads_df.columns)}
+        required_cols = ['Status', 'Prospect_Title', 'Halbert_Hook', 'Capital_Need_Hypothesis',
+                         'Selected_Email_Subject', 'Selected_Email_Body']
+        missing_cols = [c for c in required_cols if c not in col_map]
+        if missing_cols:
+            logging.critical("Sheet is missing required columns: %s. Halting.", missing_cols)
             return
     except gspread.exceptions.SpreadsheetNotFound:
-        logging.critical(f"Spreadsheet '{config.GOOGLE_SHEET_NAME}' not found. Halting.")
+        logging.critical("Spreadsheet '%s' not found. Halting.", config.GOOGLE_SHEET_NAME)
         return
     except Exception as e:
-        logging.critical(f"Could not open worksheet. Halting. Error: {e}")
+        logging.critical("Could not open worksheet. Halting. Error: %s", e)
         return
 
-    logging.info(f"--- Processing {len(leads_df)} new leads ---")
+    logging.info("--- Processing %d new leads ---", len(leads_df))
 
-    for index, lead in leads_df.iterrows():
-        row_num = index + 2
-        prospect_name = lead.get('Prospect_Name', 'N/A')
-        
-        logging.info(f"--- Processing Lead #{row_num-1}: {prospect_name} ---")
-        
-        try:
-            worksheet.update_cell(row_num, col_map['Status'], "Processing...")
-
-            # --- FIX: Removed the 'industry' argument from the function call ---
-            intelligence_report = enrichment.gather_osint( # type: ignore
-                company_name=lead.get('Company_Name'),
-                prospect_name=lead.get('Prospect_Name'),
-                prospect_email=lead.get('Prospect_Email'),
-                prospect_phone=lead.get('Prospect_Phone'),
-            )
-            
-            if "error" in intelligence_report:
-                raise ValueError(f"Enrichment failed: {intelligence_report['error']}")
-
-            outreach_assets = synthesis.create_outreach_assets(intelligence_report, prospect_name)
-            if "error" in outreach_assets:
-                raise ValueError(f"Synthesis failed: {outreach_assets['error']}")
-
-            # --- Get User Approval ---
-            approval_result = get_user_approval(lead, outreach_assets)
-            
-            # --- Prepare data for sheet update (dossier and assets) ---
-            # This data will be saved whether the email is sent or skipped.
-            cells_to_update = [
-                gspread.Cell(row_num, col_map['Prospect_Title'], outreach_assets.get('Prospect_Title', '')),
-                gspread.Cell(row_num, col_map['Halbert_Hook'], outreach_assets.get('Halbert_Hook', '')),
-                gspread.Cell(row_num, col_map['Capital_Need_Hypothesis'], outreach_assets.get('Capital_Need_Hypothesis', '')),
-                gspread.Cell(row_num, col_map['Selected_Email_Subject'], outreach_assets.get('Selected_Email_Subject', '')),
-                gspread.Cell(row_num, col_map['Selected_Email_Body'], outreach_assets.get('Selected_Email_Body', ''))
-            ]
-            if 'Dossier_JSON' in col_map:
-                cells_to_update.append(
-                    gspread.Cell(row_num, col_map['Dossier_JSON'], json.dumps(intelligence_report, indent=2))
-                )
-            if 'Sources' in col_map:
-                # Safely extract the sources list from the dossier
-                sources_data = intelligence_report.get('dossier', {}).get('sources', [])
-                cells_to_update.append(
-                    gspread.Cell(row_num, col_map['Sources'], json.dumps(sources_data, indent=2))
-                )
-
-            if approval_result == 'skip':
-                cells_to_update.append(gspread.Cell(row_num, col_map['Status'], "Skipped"))
-                worksheet.update_cells(cells_to_update)
-                logging.info(f"Lead {prospect_name} was skipped by user. Dossier saved.")
-                continue
-            
-            elif approval_result == 'approve':
-                logging.info(f"Email approved for {prospect_name}. Sending...")
-                
-                email_sent = dispatch.send_email(
-                    recipient_email=lead.get('Prospect_Email'),
-                    subject=outreach_assets.get('Selected_Email_Subject'),
-                    body=outreach_assets.get('Selected_Email_Body')
-                )
-
-                if not email_sent:
-                    raise ConnectionError("Dispatch failed. Check dispatch logs for details.")
-
-                # Add the final status and update the sheet
-                cells_to_update.append(gspread.Cell(row_num, col_map['Status'], "Sent"))
-                worksheet.update_cells(cells_to_update)
-                logging.info(f"Successfully processed and sent email to {prospect_name}. Sheet updated.")
-
-        except Exception as e:
-            error_message = f"Failed: {e}"
-            logging.error(f"Error processing lead {prospect_name}: {error_message}", exc_info=True)
-            worksheet.update_cell(row_num, col_map['Status'], error_message[:499])
-        
-        finally:
-            sleep(5)
+    # Enrichment is network-bound and independent per lead, so the whole batch
+    # runs through a worker pool and the search round trips overlap instead of
+    # serializing. Sheet writes go through a lock; user approval stays serial.
+    sheet_lock = threading.Lock()
+    # to_dict('records') materializes plain dicts once up front — iterrows
+    # would box every row into a fresh Series per iteration, and downstream
+    # code only ever calls .get on the rows anyway. The original DataFrame
+    # index rides along because it encodes each lead's sheet row.
+    leads = list(zip(leads_df.index, leads_df.to_dict('records')))
+
+    # Sheet updates are buffered and flushed in bulk: one batch_update RPC per
+    # flush instead of 1-2 round trips (~200-500ms each) per lead. The old
+    # per-lead "Processing..." write is gone — status goes New -> Sent/Skipped
+    # /Failed in a single flush.
+    pending_updates = []
+
+    def buffer_cell(row, col, value):
+        a1 = gspread.utils.rowcol_to_a1(row, col)
+        pending_updates.append({'range': a1, 'values': [[value]]})
+
+    def flush_updates():
+        if not pending_updates:
+            return
+        with sheet_lock:
+            worksheet.batch_update(pending_updates, value_input_option='RAW')
+        pending_updates.clear()
+
+    def _enrich_one(lead):
+        # --- FIX: Removed the 'industry' argument from the function call ---
+        return enrichment.gather_osint( # type: ignore
+            company_name=lead.get('Company_Name'),
+            prospect_name=lead.get('Prospect_Name'),
+            prospect_email=lead.get('Prospect_Email'),
+            prospect_phone=lead.get('Prospect_Phone'),
+        )
+
+    intelligence_reports = {}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = {
+            pool.submit(_enrich_one, lead): index
+            for index, lead in leads
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                intelligence_reports[index] = future.result()
+            except Exception as e:
+                intelligence_reports[index] = {"error": str(e)}
+
+    # Bind the hot column indices as locals once, outside the loop (LOAD_FAST
+    # beats a dict lookup per cell per lead).
+    status_col = col_map['Status']
+    title_col = col_map['Prospect_Title']
+    hook_col = col_map['Halbert_Hook']
+    hypothesis_col = col_map['Capital_Need_Hypothesis']
+    subject_col = col_map['Selected_Email_Subject']
+    body_col = col_map['Selected_Email_Body']
+    dossier_col = col_map.get('Dossier_JSON')
+    sources_col = col_map.get('Sources')
+
+    try:
+        for lead_count, (index, lead) in enumerate(leads, 1):
+            row_num = index + 2
+            prospect_name = lead.get('Prospect_Name', 'N/A')
+
+            logging.info("--- Processing Lead #%d: %s ---", row_num - 1, prospect_name)
+
+            try:
+                intelligence_report = intelligence_reports[index]
+                if "error" in intelligence_report:
+                    raise ValueError(f"Enrichment failed: {intelligence_report['error']}")
+
+                # Stream the generation: someone is sitting at the approval
+                # prompt, so time-to-first-token matters here.
+                outreach_assets = synthesis.create_outreach_assets(intelligence_report, prospect_name, stream=True)
+                if "error" in outreach_assets:
+                    raise ValueError(f"Synthesis failed: {outreach_assets['error']}")
+
+                # --- Get User Approval ---
+                approval_result = get_user_approval(lead, outreach_assets)
+
+                # --- Buffer data for sheet update (dossier and assets) ---
+                # This data will be saved whether the email is sent or skipped.
+                buffer_cell(row_num, title_col, outreach_assets.get('Prospect_Title', ''))
+                buffer_cell(row_num, hook_col, outreach_assets.get('Halbert_Hook', ''))
+                buffer_cell(row_num, hypothesis_col, outreach_assets.get('Capital_Need_Hypothesis', ''))
+                buffer_cell(row_num, subject_col, outreach_assets.get('Selected_Email_Subject', ''))
+                buffer_cell(row_num, body_col, outreach_assets.get('Selected_Email_Body', ''))
+                if dossier_col:
+                    buffer_cell(row_num, dossier_col, json.dumps(intelligence_report, indent=2))
+                if sources_col:
+                    # Safely extract the sources list from the dossier
+                    sources_data = intelligence_report.get('dossier', {}).get('sources', [])
+                    buffer_cell(row_num, sources_col, json.dumps(sources_data, indent=2))
+
+                if approval_result == 'skip':
+                    buffer_cell(row_num, status_col, "Skipped")
+                    logging.info("Lead %s was skipped by user. Dossier saved.", prospect_name)
+
+                elif approval_result == 'approve':
+                    logging.info("Email approved for %s. Sending...", prospect_name)
+
+                    email_sent = dispatch.send_email(
+                        recipient_email=lead.get('Prospect_Email'),
+                        subject=outreach_assets.get('Selected_Email_Subject'),
+                        body=outreach_assets.get('Selected_Email_Body')
+                    )
+
+                    if not email_sent:
+                        raise ConnectionError("Dispatch failed. Check dispatch logs for details.")
+
+                    buffer_cell(row_num, status_col, "Sent")
+                    logging.info("Successfully processed and sent email to %s.", prospect_name)
+
+            except Exception as e:
+                error_message = f"Failed: {e}"
+                logging.error("Error processing lead %s: %s", prospect_name, error_message, exc_info=True)
+                buffer_cell(row_num, status_col, error_message[:499])
+
+            # One Sheets RPC per ten leads instead of per lead.
+            if lead_count % 10 == 0:
+                flush_updates()
+    finally:
+        # End-of-batch (or crash) flush so buffered statuses are never lost.
+        flush_updates()
 
     logging.info("--- Pipeline run has completed. ---")
 
@@ -4,6 +4,7 @@
 
 import os
 import json
+import re
 import pandas as pd
 import google.generativeai as genai
 
@@ -23,6 +24,11 @@ except Exception as e:
 
 # --- First Name Extraction Function ---
 
+# Compiled once at import: a single C-level scan replaces the old Python loop
+# over eight prefix strings, and IGNORECASE also handles "dr. robert".
+_PREFIX_RE = re.compile(r'^(?:Professor|Prof|Dr|Mr|Mrs|Ms|Sir|Madam)\.?\s+', re.IGNORECASE)
+_PUNCT_RE = re.compile(r'[.,]+$')
+
 def extract_first_name(full_name: str) -> str:
     """
     Extracts the first name from a full name using best practices.
@@ -44,31 +50,25 @@ def extract_first_name(full_name: str) -> str:
     if not full_name or full_name.strip() == "":
         return "there"  # Fallback for empty names
     
-    # Clean the name
-    name = full_name.strip()
-    
-    # Remove common prefixes
-    prefixes = ["Dr.", "Mr.", "Mrs.", "Ms.", "Prof.", "Professor", "Sir", "Madam"]
-    for prefix in prefixes:
-        if name.startswith(prefix):
-            name = name[len(prefix):].strip()
-    
-    # Split by spaces and take the first part
-    name_parts = name.split()
-    
+    # Clean the name and drop any honorific prefix in one regex pass
+    name = _PREFIX_RE.sub('', full_name.strip(), count=1)
+
+    # Only the first two tokens matter, so cap the split there
+    name_parts = name.split(None, 2)
+
     if not name_parts:
         return "there"
-    
-    first_name = name_parts[0].strip()
-    
+
+    first_name = name_parts[0]
+
     # Handle single letters (initials) - try to get the next part
     if len(first_name) == 1 and len(name_parts) > 1:
-        second_part = name_parts[1].strip()
+        second_part = name_parts[1]
         if len(second_part) > 1:  # If second part is not also an initial
             first_name = second_part
-    
+
     # Clean up the first name
-    first_name = first_name.strip(".,")  # Remove trailing punctuation
+    first_name = _PUNCT_RE.sub('', first_name)  # Remove trailing punctuation
     
     # If we still have a single letter, use "there" as fallback
     if len(first_name) <= 1:
@@ -105,9 +105,14 @@ You MUST return a single, valid JSON object with the following five keys. Do not
     - **Use "[First Name]" as a placeholder for the prospect's first name only.**
 """
 
+# Split once at import around the report placeholder: plain concatenation per
+# call avoids re-scanning the whole template with .format(), which would also
+# choke on the literal {...} braces inside the embedded JSON report.
+_PROMPT_HEAD, _PROMPT_TAIL = MASTER_SYNTHESIS_PROMPT.split('{intelligence_report}')
+
 # --- Core Synthesis Function ---
 
-def create_outreach_assets(intelligence_report: dict, prospect_name: str):
+def create_outreach_assets(intelligence_report: dict, prospect_name: str, stream: bool = False):
     """
     Uses the Gemini API with JSON mode to reliably generate a dossier and email.
     Now includes intelligent first name extraction for better personalization.
@@ -115,6 +120,9 @@ def create_outreach_assets(intelligence_report: dict, prospect_name: str):
     Args:
         intelligence_report (dict): The structured data from enrichment.py.
         prospect_name (str): The name of the prospect for email personalization.
+        stream (bool): Stream the response and assemble it as chunks arrive.
+            Worth it for interactive runs where someone is waiting on the
+            approval screen; batch callers should keep the blocking default.
 
     Returns:
         dict: A dictionary containing the generated assets, or an error dictionary.
@@ -135,17 +143,32 @@ def create_outreach_assets(intelligence_report: dict, prospect_name: str):
     print("  [SYNTHESIZE] Generating dossier and email draft...")
     
     try:
-        report_str = json.dumps(intelligence_report, indent=2)
-        prompt = MASTER_SYNTHESIS_PROMPT.format(intelligence_report=report_str)
+        # Compact dump: indent=2 here only inflated the prompt (more tokens,
+        # slower first token) — the model parses compact JSON just as well.
+        report_str = json.dumps(intelligence_report, separators=(',', ':'))
+        prompt = _PROMPT_HEAD + report_str + _PROMPT_TAIL
         
         # --- Simplified & Reliable API Call using JSON Mode ---
-        response = model.generate_content(
-            prompt,
-            generation_config={"response_mime_type": "application/json"}
-        )
-        
+        # The shared module-level model is stateless per generate_content
+        # call, so concurrent callers (e.g. a worker pool) can reuse it.
+        if stream:
+            # Streaming overlaps model decoding with local work, so tokens
+            # start arriving well before the full generation finishes.
+            response = model.generate_content(
+                prompt,
+                generation_config={"response_mime_type": "application/json"},
+                stream=True
+            )
+            response_text = ''.join(chunk.text for chunk in response)
+        else:
+            response = model.generate_content(
+                prompt,
+                generation_config={"response_mime_type": "application/json"}
+            )
+            response_text = response.text
+
         # The response is now guaranteed to be a valid JSON string
-        generated_assets = json.loads(response.text)
+        generated_assets = json.loads(response_text)
         
         # Personalize the email body by replacing the first name placeholder
         if 'Selected_Email_Body' in generated_assets and first_name:
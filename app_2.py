@@ -7,18 +7,26 @@ import pandas as pd
 import backend2
 import config
 import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 # --- Rule Persistence Functions ---
+RULES_PATH = Path("llm_rules.txt")
+
+@st.cache_data(show_spinner=False)
 def load_rules():
     try:
-        with open("llm_rules.txt", "r") as f:
-            return [line.strip() for line in f if line.strip()]
+        return [line.strip() for line in RULES_PATH.read_text().splitlines() if line.strip()]
     except FileNotFoundError:
         return config.EMAIL_GENERATION_RULES.split('\n') if hasattr(config, 'EMAIL_GENERATION_RULES') and config.EMAIL_GENERATION_RULES else []
 
 def save_rules(rules):
-    with open("llm_rules.txt", "w") as f:
-        f.write("\n".join(rules))
+    # Skip the disk write when the file already matches.
+    content = "\n".join(rules)
+    if RULES_PATH.exists() and RULES_PATH.read_text() == content:
+        return
+    RULES_PATH.write_text(content)
+    load_rules.clear()
 
 
 # --- Skip Rule Persistence ---
@@ -52,32 +60,38 @@ with st.sidebar:
     if "llm_rules" not in st.session_state:
         st.session_state.llm_rules = load_rules()
 
-    # Rule display and removal
+    # Rule display and editing. A single data_editor replaces the old
+    # two-columns-plus-button widget trio per rule; rows are removed or
+    # reworded directly in the editor.
     if not st.session_state.llm_rules:
         st.info("No rules defined. Add rules below.")
     else:
-        st.write("**Current Rules:**")
-        for i, rule in enumerate(st.session_state.llm_rules):
-            col1, col2 = st.columns([4, 1])
-            with col1:
-                st.text(f"{i + 1}. {rule}")
-            with col2:
-                if st.button("❌", key=f"remove_rule_{i}", help="Remove this rule"):
-                    st.session_state.llm_rules.pop(i)
-                    save_rules(st.session_state.llm_rules)
-                    st.rerun()
+        with st.expander("Current Rules", expanded=False):
+            edited = st.data_editor(
+                pd.DataFrame({"rule": st.session_state.llm_rules}),
+                num_rows="dynamic",
+                hide_index=True,
+                use_container_width=True,
+                key="rules_editor",
+            )
+            edited_rules = [str(r).strip() for r in edited["rule"].dropna().tolist() if str(r).strip()]
+            if edited_rules != st.session_state.llm_rules:
+                st.session_state.llm_rules = edited_rules
+                save_rules(edited_rules)
+                st.toast("Rules updated!")
 
     st.write("---")
 
-    # Rule addition
-    new_rule = st.text_area("Enter new rule:", key="new_rule_input", placeholder="e.g., 'The email must be shorter than 150 words.'")
-    if st.button("Add Rule", type="primary"):
+    # Rule addition. The form batches typing into a single rerun on submit,
+    # and clear_on_submit empties the input without an extra st.rerun().
+    with st.form("add_rule_form", clear_on_submit=True):
+        new_rule = st.text_area("Enter new rule:", key="new_rule_input", placeholder="e.g., 'The email must be shorter than 150 words.'")
+        submitted = st.form_submit_button("Add Rule", type="primary")
+    if submitted:
         if new_rule and new_rule.strip():
             st.session_state.llm_rules.append(new_rule.strip())
             save_rules(st.session_state.llm_rules)
             st.toast("Rule added!")
-            # Clear the input box by rerunning
-            st.rerun()
         else:
             st.warning("Rule cannot be empty.")
 
@@ -125,19 +139,318 @@ with st.sidebar:
 st.title("FAST Capital Dossier & Outreach Pipeline")
 
 
-def _get_scalar_from_series(series, key, row_index_for_warning):
+@st.cache_resource
+def _worker_pool():
+    """
+    Process-lifetime worker pool for lead processing. Held in cache_resource
+    so reruns reuse it and in-flight futures survive the rerun instead of
+    being orphaned by a fresh executor.
+    """
+    return ThreadPoolExecutor(max_workers=16)
+
+@st.cache_resource
+def _send_pool():
+    """
+    Process-lifetime pool for SMTP sends, so Approve & Send queues the
+    dispatch and moves on instead of blocking the reviewer on SMTP latency.
+    """
+    return ThreadPoolExecutor(max_workers=4)
+
+@st.cache_resource(ttl=3600, show_spinner=False)
+def _gspread_client():
+    """
+    Authenticates once per server process (refreshed hourly) instead of
+    re-negotiating service-account auth on every "Load Sheet" click/rerun.
+    """
+    return backend2.authenticate_gspread()
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _sheet_columns(_worksheet, worksheet_id):
     """
-    Safely extracts a scalar value from a pandas Series, handling cases where
-    duplicate column names might cause `series.get(key)` to return a Series.
+    Caches the sheet's header row. The mapping screen reruns on every
+    selectbox change, and without this each rerun costs a Sheets API call.
+    `worksheet_id` is the cache key; the worksheet itself is underscored so
+    Streamlit doesn't try to hash it.
     """
-    val = series.get(key)
+    return list(backend2.get_column_map(_worksheet).keys())
+
+
+def _get_scalar(lead, key, row_index_for_warning):
+    """
+    Safely extracts a scalar value from a lead row, handling cases where
+    duplicate column names might cause `lead.get(key)` to return a Series.
+    Returns (value, warning_message_or_None) and renders nothing, so it is
+    safe to call from worker threads.
+    """
+    val = lead.get(key)
     if isinstance(val, pd.Series):
-        st.warning(
+        warning = (
             f"Warning for row {row_index_for_warning}: Duplicate column mapping for '{key}'. "
             f"Using the first value found. Please check your Google Sheet for columns with the same name."
         )
-        return val.iloc[0] if not val.empty else None
-    return val
+        return (val.iloc[0] if not val.empty else None), warning
+    return val, None
+
+def _process_one(index, lead, skip_rules, rules_string):
+    """
+    Processes a single lead: skip-rule check, OSINT research, email synthesis.
+    Runs on a worker thread, so it only touches backend2 — no st.* calls;
+    warnings and results are returned for the main thread to render.
+    """
+    row_num = index + 2  # GSheets are 1-indexed, +1 for header
+    warnings = []
+
+    should_skip, reason = backend2.should_skip_lead(lead, skip_rules)
+    if should_skip:
+        return {
+            'prospect_name': _get_scalar(lead, 'Prospect_Name', row_num)[0],
+            'row_index': row_num,
+            'skip_reason': reason,
+            'warnings': warnings,
+        }
+
+    # Safely extract scalar values, handling potential duplicate columns
+    scalars = {}
+    for key in ('Company_Name', 'Prospect_Name', 'Prospect_Email', 'Prospect_Phone'):
+        scalars[key], warning = _get_scalar(lead, key, row_num)
+        if warning:
+            warnings.append(warning)
+
+    dossier = backend2.gather_osint(
+        company_name=scalars['Company_Name'],
+        prospect_name=scalars['Prospect_Name'],
+        prospect_email=scalars['Prospect_Email'],
+        prospect_phone=scalars['Prospect_Phone']
+    )
+    email_assets = backend2.create_outreach_assets(dossier, scalars['Prospect_Name'], rules_string)
+
+    # Only what the review screen actually renders travels back — not the
+    # whole lead row, which would sit in session state for the life of the
+    # batch.
+    return {
+        'prospect_name': scalars['Prospect_Name'],
+        'company_name': scalars['Company_Name'],
+        'prospect_email': scalars['Prospect_Email'],
+        'dossier': dossier,
+        'email': email_assets,
+        'row_index': row_num,
+        'skip_reason': None,
+        'warnings': warnings,
+    }
+
+
+def _reconcile_sends(wait=False):
+    """
+    Reaps finished background sends: successes queue their sheet update,
+    failures are surfaced with the recipient named and a 'Send Failed'
+    status queued. With wait=True, blocks until every in-flight send
+    resolves (used before the end-of-batch flush).
+    """
+    still_pending = []
+    for send in st.session_state.in_flight_sends:
+        if not (wait or send['future'].done()):
+            still_pending.append(send)
+            continue
+        if send['future'].result():
+            st.toast(f"Email sent to {send['recipient']}.")
+            status = 'Sent'
+        else:
+            st.error(f"Failed to send email to {send['recipient']} (row {send['row']}). Check dispatch logs.")
+            status = 'Send Failed'
+        st.session_state.pending_updates.append({
+            'row': send['row'],
+            'status': status,
+            'dossier': send['dossier'],
+            'email': send['email'],
+        })
+    st.session_state.in_flight_sends = still_pending
+
+
+@st.fragment
+def _review_panel():
+    """
+    The STATE 4 review body. Runs as a fragment so each Approve/Skip click
+    re-executes only this panel between leads, instead of the whole script
+    (sidebar rule editors, state branches) from the top.
+    """
+    SKIP_REASONS = [
+        "Not a target industry",
+        "Contact person not found / invalid",
+        "Company out of business / acquired",
+        "Insufficient data for personalization",
+        "Does not appear to need funding",
+        "Already a client / in contact",
+        "Other",
+    ]
+
+    # Reap any background sends that finished since the last rerun.
+    _reconcile_sends()
+
+    # Lazily consume processing results in sheet order. The whole batch is
+    # already in flight on the worker pool, so while the user reviews lead N
+    # the later leads finish in the background; this only blocks when the
+    # next lead isn't ready yet (at most one lead's latency, typically zero).
+    while (st.session_state.current_index >= len(st.session_state.processed_data)
+           and st.session_state.lead_futures):
+        index, future = st.session_state.lead_futures.pop(0)
+        with st.spinner("Preparing next lead..."):
+            result = future.result()
+
+        for warning in result['warnings']:
+            st.warning(warning)
+
+        if result['skip_reason'] is not None:
+            row_num_for_display = result['row_index']
+            prospect_name_for_log = result['prospect_name'] or "N/A"
+            st.warning(f"Lead: {prospect_name_for_log} (Row {row_num_for_display}) skipped by rule: {result['skip_reason']}")
+            st.session_state.pending_updates.append({
+                'row': row_num_for_display,
+                'status': f"Skipped: {result['skip_reason']}",
+                'dossier': {},
+                'email': {},
+            })
+            continue
+
+        st.session_state.processed_data.append({
+            'prospect_name': result['prospect_name'],
+            'company_name': result['company_name'],
+            'prospect_email': result['prospect_email'],
+            'dossier': result['dossier'],
+            'email': result['email'],
+            'row_index': result['row_index']
+        })
+
+    if st.session_state.current_index < len(st.session_state.processed_data):
+        current_item = st.session_state.processed_data[st.session_state.current_index]
+        dossier_info = current_item['dossier']
+        email_info = current_item['email']
+        row_num = current_item['row_index']
+
+        # Scalars were extracted (and any duplicate-column issues surfaced)
+        # during processing; the review item carries them directly.
+        lead_prospect_name = current_item['prospect_name']
+        lead_company_name = current_item['company_name']
+        lead_prospect_email = current_item['prospect_email']
+
+        # Later leads may still be in flight, so the total is an upper bound
+        # (rule-skips shrink it as they are consumed).
+        total_leads = len(st.session_state.processed_data) + len(st.session_state.lead_futures)
+        st.subheader(f"Reviewing Lead {st.session_state.current_index + 1}/{total_leads}: {lead_prospect_name or 'N/A'} at {lead_company_name or 'N/A'}")
+
+        # --- Display Area ---
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown("#### Generated Dossier")
+            st.json(dossier_info, expanded=True)
+        with col2:
+            # If we are in the process of skipping this specific lead, show the reason UI
+            if st.session_state.skipping_lead_index == row_num:
+                st.markdown("#### Log Skip Reason")
+                reason = st.selectbox("Please select a reason for skipping:", options=SKIP_REASONS, index=0, key=f"skip_reason_{row_num}")
+                
+                confirm_col, cancel_col, spacer = st.columns([2, 2, 3])
+                with confirm_col:
+                    if st.button("Confirm Skip", use_container_width=True, type="primary", key=f"confirm_skip_{row_num}"):
+                        # Queued instead of written immediately — one batch
+                        # call at end of review covers every queued row.
+                        st.session_state.pending_updates.append({
+                            'row': row_num,
+                            'status': 'Skipped',
+                            'skip_reason': reason,
+                        })
+                        st.toast(f"Lead skipped: {reason}")
+                        st.session_state.skipping_lead_index = None
+                        st.session_state.current_index += 1
+                        st.rerun(scope="fragment")
+                with cancel_col:
+                    if st.button("Cancel", use_container_width=True, key=f"cancel_skip_{row_num}"):
+                        st.session_state.skipping_lead_index = None
+                        st.rerun(scope="fragment")
+            # Otherwise, show the normal email editor
+            else:
+                st.markdown("#### Generated Email")
+                edited_subject = st.text_input("Subject", email_info.get('Selected_Email_Subject', ''), key=f"subject_{row_num}")
+                edited_body = st.text_area("Body", email_info.get('Selected_Email_Body', ''), height=400, key=f"body_{row_num}")
+
+        st.write("---")
+
+        # --- Action Buttons (only show if not in skip mode) ---
+        if st.session_state.skipping_lead_index != row_num:
+            approve_col, skip_col, spacer = st.columns([2, 2, 3])
+            with approve_col:
+                if st.button("✅ Approve & Send", use_container_width=True, type="primary"):
+                    email_info['Selected_Email_Subject'] = edited_subject
+                    email_info['Selected_Email_Body'] = edited_body
+                    # The send runs on the background pool; the reviewer moves
+                    # straight to the next lead and _reconcile_sends reaps the
+                    # outcome (queueing the sheet update) on a later rerun.
+                    future = _send_pool().submit(
+                        backend2.send_email,
+                        recipient_email=lead_prospect_email,
+                        subject=edited_subject,
+                        body=edited_body
+                    )
+                    st.session_state.in_flight_sends.append({
+                        'future': future,
+                        'row': row_num,
+                        'recipient': lead_prospect_email,
+                        'dossier': dossier_info,
+                        'email': email_info,
+                    })
+                    st.toast(f"Send to {lead_prospect_email} queued.")
+                    st.session_state.current_index += 1
+                    st.rerun(scope="fragment")
+
+            with skip_col:
+                if st.button("⏩ Skip", use_container_width=True):
+                    st.session_state.skipping_lead_index = row_num
+                    st.rerun(scope="fragment")
+
+        if st.session_state.in_flight_sends:
+            st.caption(f"{len(st.session_state.in_flight_sends)} email send(s) in flight.")
+        if st.session_state.pending_updates:
+            st.caption(f"{len(st.session_state.pending_updates)} sheet update(s) queued.")
+            if st.button("Flush queued updates"):
+                success, msg = backend2.batch_update_google_sheet(
+                    st.session_state.worksheet,
+                    st.session_state.pending_updates,
+                    st.session_state.final_column_map
+                )
+                if success:
+                    st.session_state.pending_updates = []
+                    st.toast(msg)
+                else:
+                    st.error(f"Sheet Update Failed: {msg}")
+    else:
+        # Every send must resolve before the final flush so its status is
+        # part of the batch write.
+        if st.session_state.in_flight_sends:
+            with st.spinner("Waiting for queued emails to finish sending..."):
+                _reconcile_sends(wait=True)
+
+        # End-of-batch flush: all queued Sent/Skipped statuses land in one
+        # batch_update call instead of one round trip per reviewed lead.
+        if st.session_state.pending_updates:
+            with st.spinner("Writing queued updates to the sheet..."):
+                success, msg = backend2.batch_update_google_sheet(
+                    st.session_state.worksheet,
+                    st.session_state.pending_updates,
+                    st.session_state.final_column_map
+                )
+            if success:
+                st.session_state.pending_updates = []
+            else:
+                st.error(f"Sheet Update Failed: {msg}")
+
+        st.success("🎉 All leads have been reviewed. Pipeline run complete!")
+        if st.button("Start New Batch"):
+            # One C-level clear instead of deleting keys while iterating them;
+            # the rules survive the reset.
+            preserved = {k: st.session_state[k] for k in ('llm_rules', 'skip_rules') if k in st.session_state}
+            st.session_state.clear()
+            st.session_state.update(preserved)
+            st.rerun()
+
 
 # --- Session State Initialization ---
 DEFAULTS = {
@@ -151,6 +464,9 @@ DEFAULTS = {
     "all_leads": pd.DataFrame(),
     "leads_df": pd.DataFrame(),
     "processed_data": [],
+    "pending_updates": [],
+    "lead_futures": [],
+    "in_flight_sends": [],
     "current_index": 0,
     "skipping_lead_index": None, # Used to manage the two-step skip process
 }
@@ -164,16 +480,20 @@ for key, value in DEFAULTS.items():
 if not st.session_state.sheet_loaded:
     st.header("Step 1: Connect to Google Sheet")
 
-    sheet_name = st.text_input("Enter the name of your Google Sheet:", placeholder="e.g., 'My Leads Sheet'")
+    # A form defers the rerun until submit — typing in the text box no
+    # longer re-executes the script per keystroke commit.
+    with st.form("load_sheet_form"):
+        sheet_name = st.text_input("Enter the name of your Google Sheet:", placeholder="e.g., 'My Leads Sheet'")
+        load_submitted = st.form_submit_button("Load Sheet", type="primary")
 
-    if st.button("Load Sheet", type="primary"):
+    if load_submitted:
         if not sheet_name:
             st.warning("Please enter a sheet name.")
         else:
             with st.spinner("Connecting to Google Sheets..."):
                 try:
-                    # Authenticate and get client
-                    st.session_state.gspread_client = backend2.authenticate_gspread()
+                    # Authenticate and get client (cached across reruns/sessions)
+                    st.session_state.gspread_client = _gspread_client()
 
                     # Open the spreadsheet and get the first worksheet
                     spreadsheet = st.session_state.gspread_client.open(sheet_name)
@@ -184,7 +504,8 @@ if not st.session_state.sheet_loaded:
 
                 except Exception as e:
                     st.error(f"Failed to load or prepare the sheet. Error: {e}")
-                    # Reset client on failure to allow re-authentication
+                    # Drop the cached client on failure to allow re-authentication
+                    _gspread_client.clear()
                     st.session_state.gspread_client = None
 
 # STATE 2: Column Mapping - After sheet is loaded, before mapping is confirmed
@@ -211,12 +532,14 @@ elif st.session_state.sheet_loaded and not st.session_state.mapping_complete:
     }
 
     try:
-        sheet_columns = [h for h in st.session_state.worksheet.row_values(1) if h]
+        sheet_columns = _sheet_columns(st.session_state.worksheet, st.session_state.worksheet.id)
     except Exception as e:
         st.error(f"Could not read columns from the spreadsheet. Error: {e}")
         sheet_columns = []
 
     available_columns = ["---"] + sheet_columns
+    # Normalize the sheet header once instead of rescanning it per required column.
+    norm_map = {col.lower().replace("_", "").replace(" ", ""): col for col in sheet_columns}
     col1, col2 = st.columns(2)
     all_mapped = True
 
@@ -227,13 +550,8 @@ elif st.session_state.sheet_loaded and not st.session_state.mapping_complete:
             options = [create_option] + available_columns
             current_selection = st.session_state.user_mapping.get(req_col)
             if not current_selection:
-                normalized_req = req_col.lower().replace("_", "").replace(" ", "")
-                for col in sheet_columns:
-                    normalized_sheet = col.lower().replace("_", "").replace(" ", "")
-                    if normalized_req == normalized_sheet:
-                        current_selection = col
-                        break
-            
+                current_selection = norm_map.get(req_col.lower().replace("_", "").replace(" ", ""))
+
             default_index = 0
             if current_selection and current_selection in options:
                 default_index = options.index(current_selection)
@@ -265,77 +583,76 @@ elif st.session_state.mapping_complete and not st.session_state.processing_start
 
     with st.spinner("Fetching new leads based on your mapping..."):
         if st.session_state.all_leads.empty:
-            st.session_state.all_leads = backend2.get_new_leads(st.session_state.worksheet, st.session_state.user_mapping)
-    
+            all_leads = backend2.get_new_leads(st.session_state.worksheet, st.session_state.user_mapping)
+            # Duplicate rows (same Prospect_Email) would each pay a full
+            # OSINT + synthesis pass; keep the first occurrence only. The
+            # original index is preserved — it encodes each lead's sheet
+            # row, so reset_index would corrupt the status write-back.
+            if not all_leads.empty and 'Prospect_Email' in all_leads.columns:
+                deduped = all_leads.drop_duplicates(subset=['Prospect_Email'], keep='first')
+                if len(deduped) < len(all_leads):
+                    st.info(
+                        f"Found {len(all_leads)} new leads; {len(all_leads) - len(deduped)} duplicate(s) "
+                        f"with the same Prospect_Email were dropped, leaving {len(deduped)}."
+                    )
+                    all_leads = deduped
+            st.session_state.all_leads = all_leads
+
     if not st.session_state.all_leads.empty:
         st.info(f"Found {len(st.session_state.all_leads)} new leads in the Google Sheet.")
-        batch_size = st.number_input(
-            "How many leads would you like to process in this batch?",
-            min_value=1,
-            max_value=len(st.session_state.all_leads),
-            value=min(5, len(st.session_state.all_leads)),
-            step=1
-        )
-
-        if st.button("Fetch and Process Leads", type="primary"):
+        # Adjusting the spinner no longer triggers a rerun per step; only
+        # the submit button does.
+        with st.form("batch_form"):
+            batch_size = st.number_input(
+                "How many leads would you like to process in this batch?",
+                min_value=1,
+                max_value=len(st.session_state.all_leads),
+                value=min(5, len(st.session_state.all_leads)),
+                step=1
+            )
+            batch_submitted = st.form_submit_button("Fetch and Process Leads", type="primary")
+
+        if batch_submitted:
             st.session_state.processing_started = True
-            st.session_state.leads_df = st.session_state.all_leads.head(batch_size)
-
-            with st.spinner("Generating dossiers and emails... This may take a few minutes."):
-                progress_bar = st.progress(0, text="Initializing...")
-                processed_list = []
-                total = len(st.session_state.leads_df)
-                skipped_leads = []
-
-                for i, (index, lead) in enumerate(st.session_state.leads_df.iterrows()):
-                    row_num_for_display = index + 2  # For user-facing messages
-                    prospect_name_for_log = _get_scalar_from_series(lead, 'Prospect_Name', row_num_for_display) or "N/A"
-
-                    # Check if lead should be skipped
-                    should_skip, reason = backend2.should_skip_lead(lead, st.session_state.skip_rules)
-                    if should_skip:
-                        skipped_leads.append(f"- Lead: {prospect_name_for_log} (Row {row_num_for_display}) skipped: {reason}")
-                        backend2.update_google_sheet(st.session_state.worksheet, row_num_for_display, f"Skipped: {reason}", {}, {}, st.session_state.final_column_map)
-                        continue
-
-                    # Safely extract scalar values, handling potential duplicate columns
-                    company_name = _get_scalar_from_series(lead, 'Company_Name', row_num_for_display)
-                    prospect_name = _get_scalar_from_series(lead, 'Prospect_Name', row_num_for_display)
-                    prospect_email = _get_scalar_from_series(lead, 'Prospect_Email', row_num_for_display)
-                    prospect_phone = _get_scalar_from_series(lead, 'Prospect_Phone', row_num_for_display)
-
-                    progress_text = f"Processing lead {i+1}/{total}: {prospect_name or 'N/A'}"
-                    progress_bar.progress((i + 1) / total, text=progress_text)
-
-                    dossier = backend2.gather_osint(
-                        company_name=company_name,
-                        prospect_name=prospect_name,
-                        prospect_email=prospect_email,
-                        prospect_phone=prospect_phone
-                    )
-                    rules_string = "\n".join(st.session_state.llm_rules)
-                    email_assets = backend2.create_outreach_assets(dossier, prospect_name, rules_string)
-
-                    processed_list.append({
-                        'lead': lead,
-                        'dossier': dossier,
-                        'email': email_assets,
-                        'row_index': index + 2  # GSheets are 1-indexed, +1 for header
-                    })
-
-                st.session_state.processed_data = processed_list
-                
-                if skipped_leads:
-                    st.warning("Some leads were skipped based on your rules:")
-                    st.text("\n".join(skipped_leads))
-
-            st.success(f"Successfully processed {len(processed_list)} leads. Ready for review.")
+            leads_df = st.session_state.all_leads.head(batch_size)
+
+            # Duplicate sheet columns (e.g. two mapped to 'Prospect_Email')
+            # are resolved once here, keeping the first occurrence — the same
+            # choice _get_scalar made per cell — so rows can become plain
+            # dicts below.
+            dup_cols = leads_df.columns[leads_df.columns.duplicated()].unique()
+            if len(dup_cols):
+                st.warning(
+                    f"Duplicate column mapping for: {', '.join(dup_cols)}. "
+                    "Using the first value found for each. Please check your Google Sheet for columns with the same name."
+                )
+                leads_df = leads_df.loc[:, ~leads_df.columns.duplicated()]
+            st.session_state.leads_df = leads_df
+
+            rules_string = "\n".join(st.session_state.llm_rules)
+
+            # Materialize the rows as plain dicts once up front — iterrows
+            # would box every row into a fresh Series, and downstream code
+            # only ever calls .get on them. The DataFrame index rides
+            # along because it encodes each lead's sheet row.
+            records = list(zip(leads_df.index, leads_df.to_dict('records')))
+
+            # Each lead is independent and I/O-bound (search + LLM), so the
+            # whole batch is submitted to the shared worker pool right away
+            # and the review screen consumes results lazily: the user starts
+            # reviewing as soon as the first lead is ready, while the rest
+            # keep cooking in the background — no long upfront spinner.
+            pool = _worker_pool()
+            st.session_state.lead_futures = [
+                (index, pool.submit(_process_one, index, lead,
+                                    st.session_state.skip_rules, rules_string))
+                for index, lead in records
+            ]
             st.rerun()
     else:
         st.warning("No new leads found in the Google Sheet.")
         if st.button("Start Over"):
-            for key in st.session_state.keys():
-                del st.session_state[key]
+            st.session_state.clear()
             st.rerun()
 
 # STATE 3: Review - After processing is complete
@@ -343,105 +660,4 @@ elif st.session_state.mapping_complete and not st.session_state.processing_start
 # STATE 4: Review - After processing is complete
 elif st.session_state.processing_started:
     st.header("Step 4: Review and Approve Emails")
-
-    SKIP_REASONS = [
-        "Not a target industry",
-        "Contact person not found / invalid",
-        "Company out of business / acquired",
-        "Insufficient data for personalization",
-        "Does not appear to need funding",
-        "Already a client / in contact",
-        "Other",
-    ]
-
-    if st.session_state.current_index < len(st.session_state.processed_data):
-        current_item = st.session_state.processed_data[st.session_state.current_index]
-        dossier_info = current_item['dossier']
-        email_info = current_item['email']
-        row_num = current_item['row_index']
-
-        # Safely extract scalar values for display and actions
-        lead_prospect_name = _get_scalar_from_series(current_item['lead'], 'Prospect_Name', row_num)
-        lead_company_name = _get_scalar_from_series(current_item['lead'], 'Company_Name', row_num)
-        lead_prospect_email = _get_scalar_from_series(current_item['lead'], 'Prospect_Email', row_num)
-
-        st.subheader(f"Reviewing Lead {st.session_state.current_index + 1}/{len(st.session_state.processed_data)}: {lead_prospect_name or 'N/A'} at {lead_company_name or 'N/A'}")
-
-        # --- Display Area ---
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### Generated Dossier")
-            st.json(dossier_info, expanded=True)
-        with col2:
-            # If we are in the process of skipping this specific lead, show the reason UI
-            if st.session_state.skipping_lead_index == row_num:
-                st.markdown("#### Log Skip Reason")
-                reason = st.selectbox("Please select a reason for skipping:", options=SKIP_REASONS, index=0, key=f"skip_reason_{row_num}")
-                
-                confirm_col, cancel_col, spacer = st.columns([2, 2, 3])
-                with confirm_col:
-                    if st.button("Confirm Skip", use_container_width=True, type="primary", key=f"confirm_skip_{row_num}"):
-                        with st.spinner("Updating sheet..."):
-                            success, msg = backend2.skip_lead(
-                                st.session_state.worksheet, 
-                                row_num, 
-                                reason, 
-                                st.session_state.final_column_map
-                            )
-                            if success:
-                                st.toast(f"Lead skipped: {reason}")
-                            else:
-                                st.error(f"Sheet Update Failed: {msg}")
-                        
-                        st.session_state.skipping_lead_index = None
-                        st.session_state.current_index += 1
-                        st.rerun()
-                with cancel_col:
-                    if st.button("Cancel", use_container_width=True, key=f"cancel_skip_{row_num}"):
-                        st.session_state.skipping_lead_index = None
-                        st.rerun()
-            # Otherwise, show the normal email editor
-            else:
-                st.markdown("#### Generated Email")
-                edited_subject = st.text_input("Subject", email_info.get('Selected_Email_Subject', ''), key=f"subject_{row_num}")
-                edited_body = st.text_area("Body", email_info.get('Selected_Email_Body', ''), height=400, key=f"body_{row_num}")
-
-        st.write("---")
-
-        # --- Action Buttons (only show if not in skip mode) ---
-        if st.session_state.skipping_lead_index != row_num:
-            approve_col, skip_col, spacer = st.columns([2, 2, 3])
-            with approve_col:
-                if st.button("✅ Approve & Send", use_container_width=True, type="primary"):
-                    with st.spinner("Sending email and updating sheet..."):
-                        sent = backend2.send_email(
-                            recipient_email=lead_prospect_email,
-                            subject=edited_subject,
-                            body=edited_body
-                        )
-                        if sent:
-                            st.toast("Email sent successfully!")
-                            email_info['Selected_Email_Subject'] = edited_subject
-                            email_info['Selected_Email_Body'] = edited_body
-                            success, msg = backend2.update_google_sheet(st.session_state.worksheet, row_num, "Sent", dossier_info, email_info, st.session_state.final_column_map)
-                            if success:
-                                st.toast("Google Sheet updated.")
-                            else:
-                                st.error(f"Sheet Update Failed: {msg}")
-                        else:
-                            st.error("Failed to send email. Check dispatch logs.")
-                    
-                    st.session_state.current_index += 1
-                    st.rerun()
-
-            with skip_col:
-                if st.button("⏩ Skip", use_container_width=True):
-                    st.session_state.skipping_lead_index = row_num
-                    st.rerun()
-    else:
-        st.success("🎉 All leads have been reviewed. Pipeline run complete!")
-        if st.button("Start New Batch"):
-            for key in st.session_state.keys():
-                if key != 'llm_rules' and key != 'skip_rules': # Preserve rules
-                    del st.session_state[key]
-            st.rerun()
+    _review_panel()
@@ -6,15 +6,22 @@
 # - Matches backend.py patterns while keeping backend2 customizations
 
 import os
+import copy
+import hashlib
 import json
 import smtplib
 import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.message import EmailMessage
+from functools import lru_cache
 from typing import Dict, Any, List
 
 import gspread
 import pandas as pd
 from google.oauth2.service_account import Credentials
+from pydantic import BaseModel
 
 # ── Google GenAI SDK (GA) ────────────────────────────────────────────────────
 # Docs: https://ai.google.dev/gemini-api/docs/libraries
@@ -161,17 +168,27 @@ def prepare_worksheet_from_mapping(
     return final_column_map
 
 
+# Statuses that mark a row as not-yet-processed. A frozenset gives isin a
+# hashed membership probe instead of a per-element list scan.
+_NEW_STATUSES = frozenset(("", "new"))
+
+
 def get_new_leads(worksheet: gspread.Worksheet, user_mapping: Dict[str, str]) -> pd.DataFrame:
     """
-    Fetches all records, renames columns based on user mapping,
-    and filters for new leads (where Status is empty or "New").
+    Fetches the whole sheet in one get_all_values call, renames columns based
+    on user mapping, and filters for new leads (where Status is empty or "New").
     """
     try:
-        all_records = worksheet.get_all_records(head=1)
-        if not all_records:
+        # Header and data come from the same single fetch; get_all_records
+        # issues the same API call but then builds a dict per row with
+        # numeric type inference, none of which this pipeline needs — every
+        # cell is treated as a string downstream. The DataFrame index still
+        # lines up so that index + 2 is the sheet row.
+        values = worksheet.get_all_values()
+        if len(values) < 2:
             return pd.DataFrame()
 
-        df = pd.DataFrame.from_records(all_records)
+        df = pd.DataFrame(values[1:], columns=values[0])
 
         rename_map = {}
         for req_col, mapped_val in user_mapping.items():
@@ -184,8 +201,9 @@ def get_new_leads(worksheet: gspread.Worksheet, user_mapping: Dict[str, str]) ->
         if "Status" not in df.columns:
             return df
 
+        # get_all_values yields strings throughout, so no fillna/astype pass.
         new_leads_df = df[
-            df["Status"].fillna("").astype(str).str.strip().str.lower().isin(["", "new"])
+            df["Status"].str.strip().str.lower().isin(_NEW_STATUSES)
         ].copy()
 
         return new_leads_df
@@ -193,6 +211,64 @@ def get_new_leads(worksheet: gspread.Worksheet, user_mapping: Dict[str, str]) ->
         raise IOError(f"Backend Error: Unexpected error while fetching leads: {e}")
 
 
+def load_sheet_state(worksheet: gspread.Worksheet, user_mapping: Dict[str, str]):
+    """
+    One-read replacement for prepare_worksheet_from_mapping + get_new_leads.
+
+    Fetches the sheet once with get_all_values and derives the header map and
+    the new-leads DataFrame from the same payload, instead of re-reading the
+    header row per helper. A write is only issued when the mapping requires
+    columns that do not exist yet. Returns (final_column_map, new_leads_df).
+    """
+    values = worksheet.get_all_values()
+    current_headers = values[0] if values else []
+
+    new_cols_to_add = []
+    for req_col, mapped_val in user_mapping.items():
+        create_option_str = f"[Create '{req_col}' Column]"
+        if mapped_val == create_option_str and req_col not in current_headers:
+            new_cols_to_add.append(req_col)
+
+    if new_cols_to_add:
+        start_col_index = len(current_headers) + 1
+        cells_to_update = [gspread.Cell(1, start_col_index + i, col_name) for i, col_name in enumerate(new_cols_to_add)]
+        worksheet.update_cells(cells_to_update, value_input_option='RAW')
+        print(f"backend2: Added new columns: {new_cols_to_add}")
+        # The headers were appended by us, so no re-read is needed.
+        current_headers = current_headers + new_cols_to_add
+
+    final_column_map = {}
+    for req_header in REQUIRED_HEADERS:
+        sheet_col_name = user_mapping.get(req_header)
+        if not sheet_col_name:
+            raise ValueError(f"Mapping for required header '{req_header}' is missing.")
+        if sheet_col_name.startswith("[Create"):
+            sheet_col_name = req_header
+        try:
+            final_column_map[req_header] = current_headers.index(sheet_col_name) + 1
+        except ValueError:
+            raise ValueError(f"Column '{sheet_col_name}' (mapped to '{req_header}') not found in the sheet.")
+
+    if len(values) < 2:
+        return final_column_map, pd.DataFrame()
+
+    df = pd.DataFrame(values[1:], columns=values[0])
+    rename_map = {}
+    for req_col, mapped_val in user_mapping.items():
+        sheet_col = mapped_val.replace(f"[Create '{req_col}' Column]", req_col)
+        if sheet_col in df.columns:
+            rename_map[sheet_col] = req_col
+    df.rename(columns=rename_map, inplace=True)
+
+    if "Status" not in df.columns:
+        return final_column_map, df
+
+    new_leads_df = df[
+        df["Status"].str.strip().str.lower().isin(_NEW_STATUSES)
+    ].copy()
+    return final_column_map, new_leads_df
+
+
 def get_column_map(worksheet: gspread.Worksheet) -> Dict[str, int]:
     """Read the header row and return a dict mapping column names to indices (1-based)."""
     try:
@@ -222,43 +298,77 @@ def process_leads_for_review(worksheet: gspread.Worksheet, user_mapping: Dict[st
     with a 'REVIEW_PENDING' status.
     """
     print("backend2: Starting lead processing for review...")
-    final_column_map = prepare_worksheet_from_mapping(worksheet, user_mapping, REQUIRED_HEADERS)
-    new_leads_df = get_new_leads(worksheet, user_mapping)
+    final_column_map, new_leads_df = load_sheet_state(worksheet, user_mapping)
 
     if new_leads_df.empty:
         print("backend2: No new leads to process.")
         return "No new leads found to process."
 
     processed_count = 0
-    for index, row in new_leads_df.iterrows():
-        sheet_row_index = index + 2
-        prospect_name = row.get("Prospect_Name", "")
-        company_name = row.get("Company_Name", "")
-        prospect_email = row.get("Prospect_Email", "")
-        prospect_phone = row.get("Prospect_Phone", "")
-
-        print(f"backend2: Processing row {sheet_row_index}: {prospect_name} at {company_name}")
-
-        dossier = gather_osint(company_name, prospect_name, prospect_email, prospect_phone)
+    pending_updates = []
+    researched = []  # (sheet_row_index, prospect_name, dossier)
+
+    # Phase 1: research every lead. The grounded calls are network-bound and
+    # independent across leads, so they fan out over a thread pool; pool.map
+    # returns results in submission order, so row alignment is preserved.
+    lead_inputs = [
+        (
+            index + 2,
+            row.get("Prospect_Name", ""),
+            row.get("Company_Name", ""),
+            row.get("Prospect_Email", ""),
+            row.get("Prospect_Phone", ""),
+        )
+        for index, row in new_leads_df.iterrows()
+    ]
+    print(f"backend2: Researching {len(lead_inputs)} leads concurrently...")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        dossiers = list(pool.map(
+            lambda args: gather_osint(args[2], args[1], args[3], args[4]),
+            lead_inputs,
+        ))
+
+    for (sheet_row_index, prospect_name, _, _, _), dossier in zip(lead_inputs, dossiers):
         if dossier.get("error"):
-            update_google_sheet(worksheet, sheet_row_index, f"Research Failed: {dossier['error']}", {}, {}, final_column_map)
+            pending_updates.append({
+                "row": sheet_row_index,
+                "status": f"Research Failed: {dossier['error']}",
+                "dossier": {},
+                "email": {},
+            })
             continue
+        researched.append((sheet_row_index, prospect_name, dossier))
 
-        email_assets = create_outreach_assets(dossier, prospect_name)
+    # Phase 2: one synthesis round trip for the whole batch instead of one
+    # model call per lead.
+    assets_list = create_outreach_assets_batch(
+        [(dossier, prospect_name) for _, prospect_name, dossier in researched]
+    )
+
+    for (sheet_row_index, prospect_name, dossier), email_assets in zip(researched, assets_list):
         if email_assets.get("error"):
-            update_google_sheet(worksheet, sheet_row_index, f"Synthesis Failed: {email_assets['error']}", dossier, {}, final_column_map)
+            pending_updates.append({
+                "row": sheet_row_index,
+                "status": f"Synthesis Failed: {email_assets['error']}",
+                "dossier": dossier,
+                "email": {},
+            })
             continue
-
-        update_google_sheet(
-            worksheet,
-            sheet_row_index,
-            "REVIEW_PENDING",
-            dossier,
-            email_assets,
-            final_column_map,
-        )
+        pending_updates.append({
+            "row": sheet_row_index,
+            "status": "REVIEW_PENDING",
+            "dossier": dossier,
+            "email": email_assets,
+        })
         processed_count += 1
 
+    # Phase 3: one sheet write for every row's outcome.
+    if pending_updates:
+        success, msg = batch_update_google_sheet(worksheet, pending_updates, final_column_map)
+        if not success:
+            print(f"backend2: {msg}")
+            return msg
+
     summary = f"Processed {processed_count} new leads. They are now ready for review."
     print(f"backend2: {summary}")
     return summary
@@ -269,19 +379,119 @@ def get_leads_for_review(worksheet: gspread.Worksheet) -> List[Dict[str, Any]]:
     Fetches leads with 'REVIEW_PENDING' status for display in the UI.
     Returns a list of dicts, including the original row index.
     """
-    all_records = worksheet.get_all_records(head=1)
-    df = pd.DataFrame.from_records(all_records)
-    review_df = df[df["Status"].fillna("").str.strip().str.lower() == "review_pending"].copy()
+    # Same single-fetch construction as get_new_leads; every cell arrives as
+    # a string, so no fillna pass is needed.
+    values = worksheet.get_all_values()
+    if len(values) < 2:
+        return []
+    df = pd.DataFrame(values[1:], columns=values[0])
+    review_df = df[df["Status"].str.strip().str.lower() == "review_pending"].copy()
 
     # Add original sheet row index (pandas index is 0-based, sheet is 1-based with a header)
     review_df['sheet_row_index'] = review_df.index + 2
     return review_df.to_dict('records')
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# Result memoization
+# ──────────────────────────────────────────────────────────────────────────────
+# The two LLM calls are by far the most expensive steps in the pipeline, and
+# their outputs are stable for a given input: a prospect appearing twice in a
+# batch (or retried after a UI rerun) should not pay for a second research or
+# synthesis pass. Keys are normalized so trivial variation ("Foo " vs "foo")
+# still hits; values are deep-copied on the way in and out because callers
+# mutate the returned dicts (e.g. the review screen edits email bodies).
+_MEMO_LOCK = threading.Lock()
+_MEMO_MAX_ENTRIES = 256
+_OSINT_MEMO: Dict[tuple, Dict[str, Any]] = {}
+_ASSETS_MEMO: Dict[tuple, Dict[str, Any]] = {}
+
+# Second cache level on disk so results survive Streamlit restarts (deploys,
+# reloads, crashes). Content-addressed JSON files named by a blake2b digest of
+# the key; staleness is judged by file mtime. Best-effort throughout — any
+# filesystem problem just means a cache miss.
+_DISK_CACHE_DIR = os.path.join(".cache", "fc_dossier")
+_DISK_CACHE_TTL_SECONDS = 24 * 3600
+
+
+def _disk_cache_path(namespace: str, key: tuple) -> str:
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=20).hexdigest()
+    return os.path.join(_DISK_CACHE_DIR, f"{namespace}-{digest}.json")
+
+
+def _disk_cache_get(namespace: str, key: tuple):
+    path = _disk_cache_path(namespace, key)
+    try:
+        if time.time() - os.path.getmtime(path) > _DISK_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _disk_cache_set(namespace: str, key: tuple, value: Dict[str, Any]):
+    path = _disk_cache_path(namespace, key)
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp_path, path)  # atomic publish
+    except OSError:
+        pass
+
+
+def _memo_get(memo: Dict[tuple, Dict[str, Any]], namespace: str, key: tuple):
+    with _MEMO_LOCK:
+        cached = memo.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    value = _disk_cache_get(namespace, key)
+    if value is not None:
+        # Promote the disk hit so repeats in this process skip the file read.
+        with _MEMO_LOCK:
+            if len(memo) >= _MEMO_MAX_ENTRIES:
+                memo.pop(next(iter(memo)))
+            memo[key] = copy.deepcopy(value)
+    return value
+
+
+def _memo_set(memo: Dict[tuple, Dict[str, Any]], namespace: str, key: tuple, value: Dict[str, Any]):
+    with _MEMO_LOCK:
+        if len(memo) >= _MEMO_MAX_ENTRIES:
+            memo.pop(next(iter(memo)))  # drop the oldest entry
+        memo[key] = copy.deepcopy(value)
+    _disk_cache_set(namespace, key, value)
+
+
+# Cache keys carry a digest of the model id + prompt template so that editing
+# master_prompt.txt, the sample corpora, or GEMINI_MODEL_ID invalidates old
+# entries instead of replaying results generated under different instructions.
+@lru_cache(maxsize=1)
+def _osint_prompt_digest() -> str:
+    return hashlib.sha256((MODEL_ID + load_master_prompt()).encode("utf-8")).hexdigest()[:16]
+
+
+@lru_cache(maxsize=1)
+def _synthesis_prompt_digest() -> str:
+    return hashlib.sha256((MODEL_ID + _synthesis_prompt_partial()).encode("utf-8")).hexdigest()[:16]
+
+
+def _osint_cache_key(company_name, prospect_name, prospect_email, prospect_phone) -> tuple:
+    return (_osint_prompt_digest(),) + tuple(
+        str(v or "").strip().lower() for v in (company_name, prospect_name, prospect_email, prospect_phone)
+    )
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Enrichment (OSINT) with Google Search grounding
 # ──────────────────────────────────────────────────────────────────────────────
 
+# The prompt files never change within a run, so each loader reads its file
+# once per process instead of once per lead.
+@lru_cache(maxsize=1)
 def load_master_prompt() -> str:
     """Load the deep research prompt from 'master_prompt.txt'."""
     try:
@@ -291,6 +501,7 @@ def load_master_prompt() -> str:
         raise FileNotFoundError("Backend ERROR: 'master_prompt.txt' not found in the project directory.")
 
 
+@lru_cache(maxsize=1)
 def load_direct_marketing_samples() -> str:
     """Load direct marketing samples from 'direct_marketing_samples.txt'."""
     try:
@@ -301,6 +512,7 @@ def load_direct_marketing_samples() -> str:
         return ""
 
 
+@lru_cache(maxsize=1)
 def load_successful_emails() -> str:
     """Load successful email templates from 'successful_emails.txt'."""
     try:
@@ -344,6 +556,12 @@ def gather_osint(company_name: str, prospect_name: str, prospect_email: str, pro
     if GENAI_CLIENT is None:
         return {"error": "GenAI client is not configured. Check GEMINI_API_KEY and google-genai installation."}
 
+    cache_key = _osint_cache_key(company_name, prospect_name, prospect_email, prospect_phone)
+    cached = _memo_get(_OSINT_MEMO, "osint", cache_key)
+    if cached is not None:
+        print(f"backend2: OSINT cache hit for '{prospect_name}' at '{company_name}'.")
+        return cached
+
     master_prompt = load_master_prompt()
     formatted_prompt = master_prompt.format(
         prospect_name=prospect_name or "",
@@ -361,14 +579,22 @@ def gather_osint(company_name: str, prospect_name: str, prospect_email: str, pro
             temperature=0.2,
         )
 
-        response = GENAI_CLIENT.models.generate_content(
+        # Stream the response so this long research call ties up the
+        # connection chunk-by-chunk instead of buffering the whole reply
+        # server-side; grounding metadata arrives on the trailing chunk.
+        text_parts = []
+        last_chunk = None
+        for chunk in GENAI_CLIENT.models.generate_content_stream(
             model=MODEL_ID,
             contents=formatted_prompt,
             config=gen_config,
-        )
+        ):
+            if getattr(chunk, "text", None):
+                text_parts.append(chunk.text)
+            last_chunk = chunk
 
         # Parse model JSON
-        _resp_text = getattr(response, "text", "")
+        _resp_text = "".join(text_parts)
         if not _resp_text:
             _resp_text = "{}"
         try:
@@ -377,7 +603,7 @@ def gather_osint(company_name: str, prospect_name: str, prospect_email: str, pro
             data = {"dossier": {"summary": _resp_text}}
 
         # Attach grounded sources into the expected location if present
-        sources = _extract_sources_from_grounding(response)
+        sources = _extract_sources_from_grounding(last_chunk) if last_chunk is not None else []
         if sources:
             if isinstance(data, dict):
                 if "dossier" in data and isinstance(data["dossier"], dict):
@@ -386,6 +612,10 @@ def gather_osint(company_name: str, prospect_name: str, prospect_email: str, pro
                     data.setdefault("dossier", {})
                     data["dossier"].setdefault("sources", sources)
 
+        # Only successful research is memoized; errors stay retryable.
+        if isinstance(data, dict) and not data.get("error"):
+            _memo_set(_OSINT_MEMO, "osint", cache_key, data)
+
         return data
 
     except Exception as e:
@@ -435,12 +665,94 @@ You MUST return a single, valid JSON object with the following five keys. Do not
 """
 
 
+@lru_cache(maxsize=1)
+def _synthesis_prompt_partial() -> str:
+    """
+    MASTER_SYNTHESIS_PROMPT with the static sample blocks substituted once,
+    leaving only {intelligence_report} for per-call formatting. Literal braces
+    in the sample corpora are escaped so the later .format() pass restores
+    them untouched.
+    """
+    def escape(text: str) -> str:
+        return text.replace("{", "{{").replace("}", "}}")
+
+    return (
+        MASTER_SYNTHESIS_PROMPT
+        .replace("{marketing_samples}", escape(load_direct_marketing_samples()))
+        .replace("{successful_emails}", escape(load_successful_emails()))
+    )
+
+
+# Everything before this heading (instructions + both sample corpora) is
+# identical on every synthesis call and forms a strict prompt prefix, which is
+# exactly what Gemini explicit caching needs.
+_SYNTHESIS_REPORT_MARKER = "**3. Raw Intelligence Report"
+
+
+@lru_cache(maxsize=1)
+def _synthesis_prompt_parts() -> tuple:
+    """Split the substituted synthesis template into (static_prefix, dynamic_suffix) at the report section."""
+    partial = _synthesis_prompt_partial()
+    idx = partial.index(_SYNTHESIS_REPORT_MARKER)
+    return partial[:idx], partial[idx:]
+
+
+_SYNTH_CACHE_LOCK = threading.Lock()
+_SYNTH_CACHE_TTL_SECONDS = 3600
+_SYNTH_CACHE = {"name": None, "expires": 0.0}
+
+
+def _synthesis_cached_content():
+    """
+    Return the name of the server-side Gemini cache holding the static
+    synthesis prefix, creating or refreshing it on demand. Returns None when
+    explicit caching is unavailable (e.g. the prefix is under the model's
+    minimum cacheable token count), in which case callers send the full
+    prompt as before; failures back off instead of retrying every call.
+    """
+    with _SYNTH_CACHE_LOCK:
+        now = time.time()
+        if _SYNTH_CACHE["name"] and now < _SYNTH_CACHE["expires"]:
+            return _SYNTH_CACHE["name"]
+        try:
+            static_prefix, _ = _synthesis_prompt_parts()
+            cache = GENAI_CLIENT.caches.create(
+                model=MODEL_ID,
+                config=types.CreateCachedContentConfig(
+                    contents=[static_prefix],
+                    ttl=f"{_SYNTH_CACHE_TTL_SECONDS}s",
+                ),
+            )
+            _SYNTH_CACHE["name"] = cache.name
+            # Refresh a minute early so in-flight calls never hit an expired cache.
+            _SYNTH_CACHE["expires"] = now + _SYNTH_CACHE_TTL_SECONDS - 60
+        except Exception as e:
+            print(f"backend2: synthesis context cache unavailable ({e}); sending the full prompt.")
+            _SYNTH_CACHE["name"] = None
+            _SYNTH_CACHE["expires"] = now + 600
+        return _SYNTH_CACHE["name"]
+
+
 def extract_first_name(full_name: str) -> str:
     if not full_name or not isinstance(full_name, str):
         return "there"
     return full_name.split()[0]
 
 
+class OutreachAssets(BaseModel):
+    """Synthesis output contract, enforced server-side via response_schema.
+
+    Constrained decoding guarantees exactly these keys come back, so the
+    downstream code no longer depends on the model honouring the prompt's
+    Output Instructions by itself.
+    """
+    Prospect_Title: str = ""
+    Halbert_Hook: str = ""
+    Capital_Need_Hypothesis: str = ""
+    Selected_Email_Subject: str = ""
+    Selected_Email_Body: str = ""
+
+
 def create_outreach_assets(intelligence_report: Dict[str, Any], prospect_name: str, llm_rules: str = "") -> Dict[str, Any]:
     """
     Generate a condensed dossier + email assets from the prior OSINT report.
@@ -451,36 +763,54 @@ def create_outreach_assets(intelligence_report: Dict[str, Any], prospect_name: s
     if not intelligence_report or (isinstance(intelligence_report, dict) and intelligence_report.get("error")):
         return {"error": f"Invalid intelligence report received: {getattr(intelligence_report, 'error', 'N/A')}"}
 
-    marketing_samples = load_direct_marketing_samples()
-    successful_emails = load_successful_emails()
+    # The dossier can be large, so the memo key carries a digest of it
+    # rather than the report itself.
+    report_digest = hashlib.sha256(
+        json.dumps(intelligence_report, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    cache_key = (_synthesis_prompt_digest(), report_digest, str(prospect_name or ""), llm_rules)
+    cached = _memo_get(_ASSETS_MEMO, "assets", cache_key)
+    if cached is not None:
+        print(f"backend2: synthesis cache hit for '{prospect_name}'.")
+        return cached
+
     first_name = extract_first_name(prospect_name)
 
     try:
         report_str = json.dumps(intelligence_report, indent=2)
-        # Inject EMAIL_GENERATION_RULES in addition to the master synthesis prompt
-        prompt = (
-            MASTER_SYNTHESIS_PROMPT.format(
-                intelligence_report=report_str,
-                marketing_samples=marketing_samples,
-                successful_emails=successful_emails,
-            )
-            + "\n\n**Additional Email Generation Rules (must-follow):**\n" 
+        rules_tail = (
+            "\n\n**Additional Email Generation Rules (must-follow):**\n"
             + "```\n" + llm_rules + "\n```\n"
         )
 
+        # With a live server-side cache, only the dynamic suffix (report +
+        # output instructions + rules) travels per call; the cached prefix's
+        # tokens are billed at the cached rate. Without one, fall back to the
+        # full prompt.
+        cache_name = _synthesis_cached_content()
+        if cache_name:
+            _, dynamic_suffix = _synthesis_prompt_parts()
+            contents = dynamic_suffix.format(intelligence_report=report_str) + rules_tail
+        else:
+            contents = _synthesis_prompt_partial().format(intelligence_report=report_str) + rules_tail
 
         gen_config = types.GenerateContentConfig(
+            cached_content=cache_name,
             response_mime_type="application/json",
+            response_schema=OutreachAssets,
             temperature=0.3,
         )
 
         response = GENAI_CLIENT.models.generate_content(
             model=MODEL_ID,
-            contents=prompt,
+            contents=contents,
             config=gen_config,
         )
 
-        generated_assets = json.loads(response.text)
+        if response.parsed is not None:
+            generated_assets = response.parsed.model_dump()
+        else:
+            generated_assets = json.loads(response.text)
 
         # Backfill keys if the model omitted any (defensive)
         for key in [
@@ -495,12 +825,121 @@ def create_outreach_assets(intelligence_report: Dict[str, Any], prospect_name: s
         if generated_assets.get("Selected_Email_Body"):
             generated_assets["Selected_Email_Body"] = generated_assets["Selected_Email_Body"].replace("[First Name]", first_name)
 
+        _memo_set(_ASSETS_MEMO, "assets", cache_key, generated_assets)
         return generated_assets
     except Exception as e:
         print(f"backend2 ERROR: GenAI call failed in create_outreach_assets: {e}")
         return {"error": f"LLM synthesis failed: {e}"}
 
 
+def create_outreach_assets_batch(items: List[tuple], llm_rules: str = "") -> List[Dict[str, Any]]:
+    """
+    Generate email assets for several leads in one model round trip.
+
+    `items` is a list of (intelligence_report, prospect_name) pairs; the
+    return value is a list of asset dicts aligned with the input order, with
+    per-item problems reported as {'error': ...} entries. The shared prompt
+    prefix (marketing samples, email principles) is paid once for the whole
+    batch instead of once per lead, and N synthesis round trips collapse to
+    one. Memoized results are served directly; only misses go to the model.
+    """
+    results: List[Dict[str, Any]] = [None] * len(items)
+    if not items:
+        return []
+    if GENAI_CLIENT is None:
+        return [
+            {"error": "GenAI client is not configured. Check GEMINI_API_KEY and google-genai installation."}
+            for _ in items
+        ]
+
+    to_generate = []  # (position, cache_key, report, prospect_name)
+    for pos, (intelligence_report, prospect_name) in enumerate(items):
+        if not intelligence_report or (isinstance(intelligence_report, dict) and intelligence_report.get("error")):
+            results[pos] = {"error": f"Invalid intelligence report received: {getattr(intelligence_report, 'error', 'N/A')}"}
+            continue
+        report_digest = hashlib.sha256(
+            json.dumps(intelligence_report, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        cache_key = (_synthesis_prompt_digest(), report_digest, str(prospect_name or ""), llm_rules)
+        cached = _memo_get(_ASSETS_MEMO, "assets", cache_key)
+        if cached is not None:
+            results[pos] = cached
+            continue
+        to_generate.append((pos, cache_key, intelligence_report, prospect_name))
+
+    if not to_generate:
+        return results
+
+    combined_reports = [
+        {"prospect_index": i, "prospect_name": str(name or ""), "report": report}
+        for i, (_, _, report, name) in enumerate(to_generate)
+    ]
+
+    try:
+        prompt = (
+            _synthesis_prompt_partial().format(
+                intelligence_report=json.dumps(combined_reports, indent=2)
+            )
+            + "\n\n**Batch Override:**\n"
+            + f"The Raw Intelligence Report section above contains a JSON array of {len(combined_reports)} reports, "
+            + "each tagged with 'prospect_index' and 'prospect_name'. Return a single JSON array of the same "
+            + "length, in the same order, where each element is the five-key object described in the Output "
+            + "Instructions for the corresponding report.\n"
+            + "\n**Additional Email Generation Rules (must-follow):**\n"
+            + "```\n" + llm_rules + "\n```\n"
+        )
+
+        gen_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=list[OutreachAssets],
+            temperature=0.3,
+        )
+
+        response = GENAI_CLIENT.models.generate_content(
+            model=MODEL_ID,
+            contents=prompt,
+            config=gen_config,
+        )
+
+        if response.parsed is not None:
+            generated_list = [assets.model_dump() for assets in response.parsed]
+        else:
+            generated_list = json.loads(response.text)
+        if not isinstance(generated_list, list) or len(generated_list) != len(to_generate):
+            raise ValueError(
+                f"expected a JSON array of {len(to_generate)} objects, got "
+                f"{type(generated_list).__name__} of length {len(generated_list) if isinstance(generated_list, list) else 'n/a'}"
+            )
+    except Exception as e:
+        print(f"backend2 ERROR: GenAI call failed in create_outreach_assets_batch: {e}")
+        for pos, _, _, _ in to_generate:
+            results[pos] = {"error": f"LLM synthesis failed: {e}"}
+        return results
+
+    for (pos, cache_key, _, prospect_name), generated_assets in zip(to_generate, generated_list):
+        if not isinstance(generated_assets, dict):
+            results[pos] = {"error": "LLM synthesis failed: malformed element in batch response"}
+            continue
+
+        for key in [
+            "Prospect_Title",
+            "Halbert_Hook",
+            "Capital_Need_Hypothesis",
+            "Selected_Email_Subject",
+            "Selected_Email_Body",
+        ]:
+            generated_assets.setdefault(key, "")
+
+        if generated_assets.get("Selected_Email_Body"):
+            first_name = extract_first_name(prospect_name)
+            generated_assets["Selected_Email_Body"] = generated_assets["Selected_Email_Body"].replace("[First Name]", first_name)
+
+        _memo_set(_ASSETS_MEMO, "assets", cache_key, generated_assets)
+        results[pos] = generated_assets
+
+    return results
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Dispatch (Email)
 # ──────────────────────────────────────────────────────────────────────────────
@@ -524,8 +963,53 @@ def send_and_update_email(
         return False, f"Failed to send email for row {row_index}."
 
 
+# Built once at import; the "-- " line (trailing space included) is the
+# standard signature delimiter, so the body/signature join stays out of the
+# per-send path.
+SIGNATURE = """
+-- 
+Sincerely,
+
+Graham Gordon
+FastCapitalNYC.com
+Growth Funding Architect
+(o)(917) 745-3378
+info@fastcapitalnyc.com
+Apply for Funding
+""".strip("\n")
+
+# One logged-in connection is shared across a dispatch batch instead of paying
+# the TLS handshake + AUTH (~3 round trips) per email. Module-level with a lock
+# (not st.cache_resource) so backend2 stays Streamlit-free and safe to call
+# from the app's send pool workers.
+_SMTP_LOCK = threading.Lock()
+_SMTP_CONN = None
+
+
+def _get_smtp():
+    """Return the shared logged-in SMTP connection, creating it on demand. Callers must hold _SMTP_LOCK."""
+    global _SMTP_CONN
+    if _SMTP_CONN is None:
+        context = ssl.create_default_context()
+        conn = smtplib.SMTP_SSL(config.SMTP_SERVER, config.SMTP_PORT, context=context)
+        conn.login(config.SENDER_EMAIL, config.SENDER_APP_PASSWORD)
+        _SMTP_CONN = conn
+    return _SMTP_CONN
+
+
+def _drop_smtp():
+    """Discard the pooled connection so the next send reconnects. Callers must hold _SMTP_LOCK."""
+    global _SMTP_CONN
+    if _SMTP_CONN is not None:
+        try:
+            _SMTP_CONN.close()
+        except Exception:
+            pass
+        _SMTP_CONN = None
+
+
 def send_email(recipient_email: str, subject: str, body: str) -> bool:
-    """Send email via SMTP using creds from config."""
+    """Send email via SMTP using creds from config, reusing a pooled connection."""
     if not all([config.SENDER_EMAIL, config.SENDER_APP_PASSWORD]):
         print("Backend Error: SENDER_EMAIL or SENDER_APP_PASSWORD not set in config.")
         return False
@@ -537,29 +1021,22 @@ def send_email(recipient_email: str, subject: str, body: str) -> bool:
     msg["Subject"] = subject
     msg["From"] = config.SENDER_EMAIL
     msg["To"] = recipient_email
-
-    signature = """
--- 
-Sincerely,
-
-Graham Gordon
-FastCapitalNYC.com
-Growth Funding Architect
-(o)(917) 745-3378
-info@fastcapitalnyc.com
-Apply for Funding
-""".strip("\n")
-    full_body = body + "\n\n" + signature
-    msg.set_content(full_body)
+    # Explicit charset skips the ASCII-first content autodetection pass.
+    msg.set_content("\n\n".join((body, SIGNATURE)), charset="utf-8")
 
     try:
-        context = ssl.create_default_context()
-        with smtplib.SMTP_SSL(config.SMTP_SERVER, config.SMTP_PORT, context=context) as server:
-            server.login(config.SENDER_EMAIL, config.SENDER_APP_PASSWORD)
-            server.send_message(msg)
+        with _SMTP_LOCK:
+            try:
+                _get_smtp().send_message(msg)
+            except (smtplib.SMTPException, OSError):
+                # Gmail drops idle sessions; rebuild the connection once and retry.
+                _drop_smtp()
+                _get_smtp().send_message(msg)
         print(f"backend2: Email sent successfully to {recipient_email}.")
         return True
     except Exception as e:
+        with _SMTP_LOCK:
+            _drop_smtp()
         print(f"Backend ERROR: Failed to send email: {e}")
         return False
 
@@ -575,19 +1052,77 @@ def skip_lead(
     col_map: Dict[str, int],
 ):
     """Updates a lead's status to 'Skipped' and logs the reason."""
-    try:
-        cells_to_update = [
-            gspread.Cell(row_index, col_map["Status"], "Skipped"),
-        ]
-        if "Skip Reason" in col_map:
-            cells_to_update.append(
-                gspread.Cell(row_index, col_map["Skip Reason"], reason)
-            )
-        
-        worksheet.update_cells(cells_to_update)
+    success, msg = batch_update_google_sheet(
+        worksheet,
+        [{"row": row_index, "status": "Skipped", "skip_reason": reason}],
+        col_map,
+    )
+    if success:
         return True, f"Successfully skipped row {row_index} with reason: {reason}."
+    return success, msg
+
+
+def batch_update_google_sheet(
+    worksheet: gspread.Worksheet,
+    pending: List[Dict[str, Any]],
+    col_map: Dict[str, int],
+):
+    """
+    Flush a queue of per-lead updates in a single batch_update call.
+
+    Each queued item is {'row': int, 'status': str, ...} plus either
+    'skip_reason' (writes Status + Skip Reason only, like skip_lead) or
+    'dossier'/'email' dicts (writes the full result columns, like
+    update_google_sheet). One API round trip covers the whole queue
+    instead of one per lead.
+    """
+    if not pending:
+        return True, "No pending updates to flush."
+    try:
+        data = []
+
+        def queue_cell(row, col, value):
+            data.append({
+                "range": gspread.utils.rowcol_to_a1(row, col),
+                "values": [[value]],
+            })
+
+        for item in pending:
+            row = item["row"]
+            queue_cell(row, col_map["Status"], item.get("status", ""))
+
+            if "skip_reason" in item:
+                if "Skip Reason" in col_map:
+                    queue_cell(row, col_map["Skip Reason"], item["skip_reason"])
+                continue
+
+            email_assets = item.get("email") or {}
+            dossier = item.get("dossier") or {}
+            for key in (
+                "Prospect_Title",
+                "Halbert_Hook",
+                "Capital_Need_Hypothesis",
+                "Selected_Email_Subject",
+                "Selected_Email_Body",
+            ):
+                queue_cell(row, col_map[key], email_assets.get(key, ""))
+
+            if "Dossier_JSON" in col_map:
+                queue_cell(row, col_map["Dossier_JSON"], json.dumps(dossier, indent=2))
+            if "Sources" in col_map:
+                sources_data = []
+                if isinstance(dossier, dict):
+                    sources_data = (
+                        dossier.get("dossier", {}).get("sources")
+                        or dossier.get("sources")
+                        or []
+                    )
+                queue_cell(row, col_map["Sources"], json.dumps(sources_data, indent=2))
+
+        worksheet.batch_update(data, value_input_option="RAW")
+        return True, f"Successfully flushed {len(pending)} queued row update(s) in one batch."
     except Exception as e:
-        return False, f"Failed to update sheet for skip: {e}"
+        return False, f"Failed to batch-update sheet: {e}"
 
 
 def update_google_sheet(
@@ -598,35 +1133,16 @@ def update_google_sheet(
     email_assets: Dict,
     col_map: Dict[str, int],
 ):
-    """Update a single lead row with results in the provided worksheet."""
-    try:
-        cells_to_update = [
-            gspread.Cell(row_index, col_map["Status"], status),
-            gspread.Cell(row_index, col_map["Prospect_Title"], email_assets.get("Prospect_Title", "")),
-            gspread.Cell(row_index, col_map["Halbert_Hook"], email_assets.get("Halbert_Hook", "")),
-            gspread.Cell(row_index, col_map["Capital_Need_Hypothesis"], email_assets.get("Capital_Need_Hypothesis", "")),
-            gspread.Cell(row_index, col_map["Selected_Email_Subject"], email_assets.get("Selected_Email_Subject", "")),
-            gspread.Cell(row_index, col_map["Selected_Email_Body"], email_assets.get("Selected_Email_Body", "")),
-        ]
-
-        # Safely add JSON data if the columns exist
-        if "Dossier_JSON" in col_map:
-            cells_to_update.append(
-                gspread.Cell(row_index, col_map["Dossier_JSON"], json.dumps(dossier, indent=2))
-            )
-        if "Sources" in col_map:
-            sources_data = []
-            if isinstance(dossier, dict):
-                sources_data = (
-                    dossier.get("dossier", {}).get("sources")
-                    or dossier.get("sources")
-                    or []
-                )
-            cells_to_update.append(
-                gspread.Cell(row_index, col_map["Sources"], json.dumps(sources_data, indent=2))
-            )
-
-        worksheet.update_cells(cells_to_update)
+    """
+    Update a single lead row with results in the provided worksheet.
+    Thin wrapper over batch_update_google_sheet with a one-item queue, so
+    single-row and batched writes share the same range-building path.
+    """
+    success, msg = batch_update_google_sheet(
+        worksheet,
+        [{"row": row_index, "status": status, "dossier": dossier, "email": email_assets}],
+        col_map,
+    )
+    if success:
         return True, f"Successfully updated row {row_index} with status '{status}'."
-    except Exception as e:
-        return False, f"Failed to update sheet: {e}"
\ No newline at end of file
+    return success, msg
\ No newline at end of file
@@ -4,6 +4,7 @@
 
 import os
 import json
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # --- Instructions ---
@@ -58,8 +59,14 @@ EMAIL_GENERATION_RULES = f"""
 """
 
 # --- Validation Function ---
+@lru_cache(maxsize=1)
 def validate_config():
-    """Checks for presence and validity of essential configuration variables."""
+    """
+    Checks for presence and validity of essential configuration variables.
+
+    Cached for the process lifetime: the values are read once at import, so
+    re-validating (e.g. on every Streamlit rerun) can never change the answer.
+    """
     print("\n--- Validating Configuration ---")
     essential_vars = {
         "GEMINI_API_KEY": GEMINI_API_KEY,